@@ -77,6 +77,8 @@ let apiConnectionPromise = null;
 let eventPollTimer = null;
 let eventPollInFlight = false;
 let eventPollRequested = false;
+let eventStreamStarted = false;
+let eventDispatchChain = Promise.resolve();
 let queueRefreshTimer = null;
 let queueRefreshForceReload = false;
 let browserQueue = [];
@@ -107,6 +109,8 @@ const MAX_LOG_TIMELINE_ENTRIES = 2000;
 const SEARCH_RENDER_DEBOUNCE_MS = 180;
 const DOUBLE_SHIFT_WINDOW_MS = 360;
 const EVENT_POLL_INTERVAL_MS = 250;
+const EVENT_SAFETY_POLL_INTERVAL_MS = 5000;
+const EVENT_LONG_POLL_TIMEOUT_SEC = 25;
 const QUEUE_ROW_HEIGHT = 20;
 const VIRTUAL_OVERSCAN_ROWS = 14;
 const VIRTUAL_FETCH_BUFFER_ROWS = 80;
@@ -5955,6 +5959,10 @@ function buildSettingsFormHtml(settings) {
                 </select>
               </div>
             </div>
+            <div class="form-block">
+              <label for="st-steamcmd-instances" class="settings-inline-note-host">SteamCMD Instances <span class="settings-inline-note">Anonymous only</span></label>
+              <input id="st-steamcmd-instances" class="form-control" type="number" min="1" max="8" value="${Number(settings.steamcmd_instances || 1)}">
+            </div>
           </div>
           <div class="form-divider"></div>
           <div class="form-grid">
@@ -6063,6 +6071,7 @@ async function openSettingsEditor() {
         setNumber("st-batch", state.settingsDefaults.batch_size);
         setSelect("st-existing", state.settingsDefaults.steamcmd_existing_mod_behavior);
         setSelect("st-folder-format", state.settingsDefaults.folder_naming_format);
+        setNumber("st-steamcmd-instances", state.settingsDefaults.steamcmd_instances);
 
         setCheck("st-download-btn", state.settingsDefaults.download_button);
         setCheck("st-search-bar", state.settingsDefaults.show_searchbar);
@@ -6126,6 +6135,7 @@ async function openSettingsEditor() {
         batch_size: Math.max(1, Number(root.querySelector("#st-batch").value || state.settingsDefaults.batch_size)),
         steamcmd_existing_mod_behavior: root.querySelector("#st-existing").value,
         folder_naming_format: root.querySelector("#st-folder-format").value,
+        steamcmd_instances: Math.min(8, Math.max(1, Number(root.querySelector("#st-steamcmd-instances").value || state.settingsDefaults.steamcmd_instances))),
         download_button: root.querySelector("#st-download-btn").checked,
         show_searchbar: root.querySelector("#st-search-bar").checked,
         show_commands_button: true,
@@ -7904,60 +7914,66 @@ function applyQueueStatusDelta(previousStatus, nextStatus) {
   }
 }
 
-function applyQueueStatusEvent(payload) {
-  const modId = String(payload?.mod_id || "").trim();
-  if (!modId) {
-    return;
-  }
-
-  const nextStatus = String(payload?.status || "Queued");
+function applyQueueStatusBatchEvent(payload) {
+  const modIds = Array.isArray(payload?.mod_ids) ? payload.mod_ids : [];
+  const statuses = Array.isArray(payload?.statuses) ? payload.statuses : [];
+  const previousStatuses = Array.isArray(payload?.previous_statuses) ? payload.previous_statuses : [];
+  const retryCounts = Array.isArray(payload?.retry_counts) ? payload.retry_counts : [];
+  const failureDetails = Array.isArray(payload?.failure_details) ? payload.failure_details : [];
   const invalidateQueueView = !!payload?.invalidate_queue_view;
-  const retryCount = Math.max(0, Number(payload?.retry_count || 0));
   const maxRetries = Math.max(1, Number(payload?.max_retries || 3));
-  const failureDetail = String(payload?.failure_detail || "");
-  const previousBadgeWidth = state.rowCache
-    .get(modId)
-    ?.querySelector('.queue-status-badge')
-    ?.getBoundingClientRect().width || 0;
-  let previousStatus = payload?.previous_status !== undefined && payload?.previous_status !== null
-    ? String(payload.previous_status)
-    : "";
-  let touched = false;
-
-  const updateItemStatus = (item) => {
-    if (!item || String(item.mod_id) !== modId) {
-      return false;
-    }
-    if (!previousStatus) {
-      previousStatus = String(item.status || "");
-    }
-    item.status = nextStatus;
-    item.retry_count = retryCount;
-    item.max_retries = maxRetries;
-    item.failure_detail = failureDetail;
-    return true;
-  };
 
-  if (Array.isArray(state.queue) && state.queue.length) {
-    for (const item of state.queue) {
-      if (updateItemStatus(item)) {
-        touched = true;
-        break;
-      }
+  const updates = new Map();
+  modIds.forEach((rawModId, index) => {
+    const modId = String(rawModId || "").trim();
+    if (!modId) {
+      return;
     }
+    const previousStatus = previousStatuses[index];
+    updates.set(modId, {
+      status: String(statuses[index] || "Queued"),
+      previousStatus: previousStatus !== undefined && previousStatus !== null ? String(previousStatus) : "",
+      retryCount: Math.max(0, Number(retryCounts[index] || 0)),
+      failureDetail: String(failureDetails[index] || ""),
+      previousBadgeWidth: state.rowCache
+        .get(modId)
+        ?.querySelector('.queue-status-badge')
+        ?.getBoundingClientRect().width || 0,
+      touched: false
+    });
+  });
+  if (!updates.size) {
+    return;
   }
 
-  if (Array.isArray(virtualBackendPageItems) && virtualBackendPageItems.length) {
-    for (const item of virtualBackendPageItems) {
-      if (updateItemStatus(item)) {
-        touched = true;
-        break;
+  const updateItems = (items) => {
+    if (!Array.isArray(items) || !items.length) {
+      return;
+    }
+    for (const item of items) {
+      const update = item ? updates.get(String(item.mod_id)) : null;
+      if (!update) {
+        continue;
       }
+      if (!update.previousStatus) {
+        update.previousStatus = String(item.status || "");
+      }
+      item.status = update.status;
+      item.retry_count = update.retryCount;
+      item.max_retries = maxRetries;
+      item.failure_detail = update.failureDetail;
+      update.touched = true;
     }
-  }
+  };
+  updateItems(state.queue);
+  updateItems(virtualBackendPageItems);
 
-  if (previousStatus || touched) {
-    applyQueueStatusDelta(previousStatus, nextStatus);
+  let anyTouched = false;
+  for (const update of updates.values()) {
+    if (update.previousStatus || update.touched) {
+      applyQueueStatusDelta(update.previousStatus, update.status);
+    }
+    anyTouched = anyTouched || update.touched;
   }
 
   if (invalidateQueueView) {
@@ -7965,21 +7981,48 @@ function applyQueueStatusEvent(payload) {
     return;
   }
 
+  const animateUpdates = () => {
+    for (const [modId, update] of updates) {
+      if (update.touched || virtualBackendEnabled) {
+        animateQueueStatusChange(modId, update.status, update.previousBadgeWidth);
+      }
+    }
+  };
+
   if (virtualBackendEnabled) {
     renderQueueViewport(true);
-    animateQueueStatusChange(modId, nextStatus, previousBadgeWidth);
+    animateUpdates();
     updateSearchPlaceholder();
     return;
   }
 
-  if (touched) {
+  if (anyTouched) {
     renderQueue();
-    animateQueueStatusChange(modId, nextStatus, previousBadgeWidth);
+    animateUpdates();
   } else {
     updateSearchPlaceholder();
   }
 }
 
+async function resyncAfterEventGap(payload) {
+  const missed = Math.max(0, Number(payload.missed_to || 0) - Number(payload.missed_from || 0) + 1);
+  addLog(`Missed ${missed} backend events; resynchronizing.`, "warn", {
+    source: "system",
+    action: "event_gap"
+  });
+  scheduleQueueRefresh(true);
+  try {
+    const data = await callApi("get_bootstrap_data");
+    state.isDownloading = Boolean(data?.download_state?.is_downloading);
+    if (!state.isDownloading) {
+      state.cancelPending = false;
+    }
+    syncStartButton();
+  } catch {
+    // The next poll will retry; the queue refresh above already ran.
+  }
+}
+
 async function handleEvent(event) {
   if (!event || typeof event.id !== "number") {
     return;
@@ -8000,6 +8043,11 @@ async function handleEvent(event) {
     return;
   }
 
+  if (type === "gap") {
+    await resyncAfterEventGap(payload);
+    return;
+  }
+
   if (type === "queue") {
     scheduleQueueRefresh(true);
     return;
@@ -8008,8 +8056,8 @@ async function handleEvent(event) {
     queueNewEntryAnimations(payload.mod_ids);
     return;
   }
-  if (type === "queue_status") {
-    applyQueueStatusEvent(payload);
+  if (type === "queue_status_batch") {
+    applyQueueStatusBatchEvent(payload);
     return;
   }
 
@@ -8066,6 +8114,27 @@ async function handleEvent(event) {
   }
 }
 
+function dispatchEvents(events) {
+  eventDispatchChain = eventDispatchChain
+    .then(async () => {
+      for (const event of events || []) {
+        if (!event || typeof event.id !== "number" || event.id <= state.lastEventId) {
+          continue;
+        }
+        await handleEvent(event);
+      }
+    })
+    .catch(() => {});
+  return eventDispatchChain;
+}
+
+window.streamlineReceiveEvents = (events) => {
+  if (appShuttingDown) {
+    return;
+  }
+  void dispatchEvents(events);
+};
+
 async function pollEvents() {
   if (!state.apiAvailable) {
     return;
@@ -8079,10 +8148,7 @@ async function pollEvents() {
     do {
       eventPollRequested = false;
       const result = await callApi("poll_events", state.lastEventId);
-      const events = result?.events || [];
-      for (const event of events) {
-        await handleEvent(event);
-      }
+      await dispatchEvents(result?.events || []);
     } while (eventPollRequested && state.apiAvailable && !appShuttingDown);
   } catch {
     // Ignore polling failures; init flow handles no-bridge mode separately.
@@ -8091,19 +8157,48 @@ async function pollEvents() {
   }
 }
 
-function startEventPolling() {
+async function runEventLongPoll() {
+  while (state.apiAvailable && !appShuttingDown) {
+    let events = [];
+    try {
+      const result = await callApi("poll_events", state.lastEventId, EVENT_LONG_POLL_TIMEOUT_SEC);
+      events = result?.events || [];
+      await dispatchEvents(events);
+    } catch {
+      events = [];
+    }
+    if (!events.length) {
+      await new Promise((resolve) => window.setTimeout(resolve, EVENT_POLL_INTERVAL_MS));
+    }
+  }
+}
+
+async function startEventPolling() {
+  if (appShuttingDown || eventStreamStarted) {
+    return;
+  }
+  eventStreamStarted = true;
+  let subscribed = false;
+  try {
+    const result = await callApi("subscribe_events", state.lastEventId);
+    subscribed = Boolean(result?.success);
+  } catch {
+    subscribed = false;
+  }
   if (appShuttingDown) {
     return;
   }
-  if (eventPollTimer) {
+  if (!subscribed) {
+    void runEventLongPoll();
     return;
   }
+  // Pushed batches carry the live stream; this slow poll only backfills anything a failed push dropped.
   eventPollTimer = window.setInterval(() => {
     if (appShuttingDown) {
       return;
     }
     pollEvents();
-  }, EVENT_POLL_INTERVAL_MS);
+  }, EVENT_SAFETY_POLL_INTERVAL_MS);
 }
 
 function revealAppWindow() {
@@ -8249,7 +8344,7 @@ async function connectToPythonApi() {
       state.apiAvailable = true;
       await useBootstrapData(data);
       addLog("Connected to Python API.", "good");
-      startEventPolling();
+      void startEventPolling();
       return true;
     } catch (error) {
       applyTheme("Dark");
@@ -1,4 +1,5 @@
 import ctypes
+import json
 import os
 import platform
 import shutil
@@ -33,6 +34,8 @@ DEFAULT_SETTINGS = {
     "current_theme": "Default",
     "modal_text_color": "",
     "batch_size": 10,
+    "steamcmd_instances": 1,
+    "webapi_download_buffer_kb": 1024,
     "show_logs": True,
     "show_provider": True,
     "show_queue_entire_workshop": True,
@@ -206,12 +209,28 @@ class WebMainGuiApi:
     def get_bootstrap_data(self):
         return self.backend.get_bootstrap_data()
 
-    def poll_events(self, last_event_id=0):
-        return {"events": self.backend.poll_events(last_event_id)}
+    def poll_events(self, last_event_id=0, timeout_sec=0):
+        return {"events": self.backend.poll_events(last_event_id, timeout_sec)}
+
+    def _push_events_to_window(self, events):
+        window = self._get_window()
+        if window is None:
+            return False
+        window.run_js(f"window.streamlineReceiveEvents && window.streamlineReceiveEvents({json.dumps(events)});")
+        return True
+
+    def subscribe_events(self, last_event_id=0):
+        if self._get_window() is None:
+            return {"success": False, "error": "Window is not ready."}
+        self.backend.set_event_sink(self._push_events_to_window, last_event_id)
+        return {"success": True}
 
     def open_downloads_folder(self, mod_id=None):
         return self.backend.open_downloads_folder(mod_id)
 
+    def get_network_stats(self):
+        return self.backend.get_network_stats()
+
     def get_preview_queue(self):
         return self.backend.get_preview_queue()
 
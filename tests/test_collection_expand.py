@@ -0,0 +1,79 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from web_backend import StreamlineWebBackend
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+class FakeSteamApi:
+    def __init__(self, collections, titles):
+        self.collections = collections
+        self.titles = titles
+
+    def post(self, url, data=None, timeout=None):
+        if "GetCollectionDetails" in url:
+            details = []
+            for index in range(int(data["collectioncount"])):
+                collection_id = data[f"publishedfileids[{index}]"]
+                children = self.collections.get(collection_id)
+                if children is None:
+                    details.append({"publishedfileid": collection_id, "result": 9})
+                    continue
+                details.append({
+                    "publishedfileid": collection_id,
+                    "result": 1,
+                    "children": [
+                        {"publishedfileid": child_id, "filetype": 2 if child_id in self.collections else 0, "sortorder": order}
+                        for order, child_id in enumerate(children)
+                    ],
+                })
+            return FakeResponse({"response": {"collectiondetails": details}})
+        details = []
+        for index in range(int(data["itemcount"])):
+            mod_id = data[f"publishedfileids[{index}]"]
+            if mod_id in self.titles:
+                details.append({"publishedfileid": mod_id, "result": 1, "title": self.titles[mod_id], "consumer_app_id": 294100})
+        return FakeResponse({"response": {"publishedfiledetails": details}})
+
+
+@pytest.fixture
+def backend(tmp_path):
+    files_dir = tmp_path / "Files"
+    files_dir.mkdir()
+    instance = StreamlineWebBackend(str(tmp_path / "downloader.py"), str(files_dir), {"batch_size": 10}, "test")
+    instance.hydration_requests = []
+    instance._schedule_mod_metadata_hydration = lambda mod_ids, **kwargs: instance.hydration_requests.extend(mod_ids)
+    yield instance
+    instance.shutdown()
+
+
+def test_unresolved_children_are_queued_for_hydration(backend):
+    backend.http.post = FakeSteamApi({"100": ["1", "2", "200"], "200": ["3", "100"]}, {"1": "First", "3": "Third"}).post
+    queued = []
+
+    found = backend._expand_collection("100", on_batch=lambda mods: queued.extend(backend._append_mods_to_queue_bulk(mods, "SteamCMD")["added_mod_ids"]))
+
+    assert found == 3
+    assert sorted(queued) == ["1", "2", "3"]
+    assert backend._queue_mod_map["2"]["mod_name"] == "Mod 2"
+    assert backend._queue_mod_map["3"]["mod_name"] == "Third"
+    assert "2" in backend.hydration_requests
+
+
+def test_unreadable_root_collection_falls_back(backend):
+    backend.http.post = FakeSteamApi({}, {}).post
+    batches = []
+
+    assert backend._expand_collection("100", on_batch=batches.append) is None
+    assert batches == []
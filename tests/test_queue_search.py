@@ -0,0 +1,55 @@
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from web_backend import QueueSearchIndex, regex_required_literals
+
+
+MOD_NAMES = ["Alpha Centauri", "alphabet soup", "Beta Alpha", "Gamma", "Alps 101", "AA lpha"]
+
+
+def build_index():
+    index = QueueSearchIndex()
+    index.sync([{"mod_id": str(1000 + position), "mod_name": name} for position, name in enumerate(MOD_NAMES)])
+    return index
+
+
+def brute_force(pattern, case_sensitive):
+    compiled = re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+    return {
+        str(1000 + position)
+        for position, name in enumerate(MOD_NAMES)
+        if compiled.search(name) or compiled.search(str(1000 + position))
+    }
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"\x41lpha",
+        r"Alpha",
+        r"\U00000041lpha",
+        r"\101lpha",
+        r"\N{LATIN CAPITAL LETTER A}lpha",
+        r"(A)\1 ?lpha",
+        r"Al\x70s \d+",
+        r"alpha",
+    ],
+)
+@pytest.mark.parametrize("case_sensitive", [False, True])
+def test_regex_escapes_do_not_drop_matches(pattern, case_sensitive):
+    matched, regex_error = build_index().match(pattern, regex_enabled=True, case_sensitive=case_sensitive)
+    assert not regex_error
+    assert matched == brute_force(pattern, case_sensitive)
+
+
+def test_escape_operands_are_not_required_literals():
+    assert regex_required_literals(r"\x41lpha") == ["lpha"]
+    assert regex_required_literals(r"A\U00000042\101cd") == ["A", "cd"]
+    assert regex_required_literals(r"\N{DIGIT ONE}23") == ["23"]
+    assert regex_required_literals(r"(ab)\12x") == ["x"]
+    assert regex_required_literals(r"foo\.bar") == ["foo.bar"]
@@ -3,14 +3,22 @@ import os
 import platform
 import re
 import shutil
+import sqlite3
 import subprocess
+import sys
 import threading
 import time
 import webbrowser
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from itertools import islice
 import base64
 import csv
 import ctypes
+import hashlib
+import zlib
 import io
 
 import requests
@@ -278,6 +286,1655 @@ class SteamCmdInteractiveSession:
             self._reader_thread = None
 
 
+class SteamCmdWorker:
+    def __init__(self, steamcmd_exe: str, steamcmd_dir: str, login_parts, install_dir: str = ""):
+        self.steamcmd_exe = steamcmd_exe
+        self.steamcmd_dir = steamcmd_dir
+        self.login_parts = list(login_parts or ["anonymous"])
+        self.install_dir = str(install_dir or "")
+        self.items_done = 0
+        self.item_ids = set()
+        self.last_used = time.time()
+
+        self._lines = deque()
+        self._lines_ready = threading.Condition()
+        self._eof = False
+        self._popen = None
+        self._reader_thread = None
+
+    def _reader_loop(self):
+        stdout = self._popen.stdout if self._popen else None
+        try:
+            for line in stdout or ():
+                with self._lines_ready:
+                    self._lines.append(line)
+                    self._lines_ready.notify()
+        except Exception:
+            pass
+        with self._lines_ready:
+            self._eof = True
+            self._lines_ready.notify_all()
+
+    def start(self):
+        cmd = [self.steamcmd_exe, "+@NoPromptForPassword", "1"]
+        if self.install_dir:
+            cmd.extend(["+force_install_dir", self.install_dir])
+        cmd.extend(["+login", *self.login_parts])
+        self._popen = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            cwd=self.steamcmd_dir,
+            shell=False,
+            creationflags=subprocess.CREATE_NO_WINDOW if platform.system().lower() == "windows" else 0,
+        )
+        self._reader_thread = threading.Thread(target=self._reader_loop, name="steamcmd-worker-reader", daemon=True)
+        self._reader_thread.start()
+        return self._popen
+
+    @property
+    def process(self):
+        return self._popen
+
+    def is_running(self):
+        return bool(self._popen and self._popen.poll() is None)
+
+    def discard_output(self):
+        with self._lines_ready:
+            self._lines.clear()
+
+    def submit(self, items):
+        if not self.is_running() or not self._popen.stdin:
+            return False
+        try:
+            for app_id, mod_id in items:
+                self._popen.stdin.write(f"workshop_download_item {app_id} {mod_id}\n")
+            self._popen.stdin.flush()
+            return True
+        except Exception:
+            return False
+
+    def read_line(self, timeout):
+        with self._lines_ready:
+            if not self._lines and not self._eof:
+                self._lines_ready.wait(timeout)
+            if self._lines:
+                return self._lines.popleft()
+            return "" if self._eof else None
+
+    def close(self, force=False):
+        popen = self._popen
+        if popen is None:
+            return
+        try:
+            if popen.poll() is None:
+                if force:
+                    popen.terminate()
+                else:
+                    try:
+                        popen.stdin.write("quit\n")
+                        popen.stdin.flush()
+                    except Exception:
+                        popen.terminate()
+                try:
+                    popen.wait(timeout=2.5)
+                except Exception:
+                    popen.kill()
+        except Exception:
+            pass
+        for stream in (popen.stdin, popen.stdout):
+            try:
+                if stream:
+                    stream.close()
+            except Exception:
+                pass
+
+
+WEBAPI_HASH_BLOCK_SIZE = 8 << 20
+
+
+class BlockDigestCursor:
+    def __init__(self, block_digests, offset=0, seed_path="", seed_from=None, block_size=WEBAPI_HASH_BLOCK_SIZE):
+        self.block_digests = block_digests
+        self.block_size = block_size
+        self.index = offset // block_size
+        self.filled = 0
+        self._hasher = hashlib.sha256()
+        if seed_from is None:
+            seed_from = self.index * block_size
+        if seed_from < offset:
+            self.index = seed_from // block_size
+            with open(seed_path, "rb") as file:
+                file.seek(self.index * block_size)
+                remaining = offset - self.index * block_size
+                while remaining > 0:
+                    chunk = file.read(min(remaining, 1 << 20))
+                    if not chunk:
+                        raise OSError(f"Partial file is shorter than {offset} bytes.")
+                    self.update(chunk)
+                    remaining -= len(chunk)
+
+    def update(self, data):
+        view = memoryview(data)
+        while view:
+            take = min(len(view), self.block_size - self.filled)
+            self._hasher.update(view[:take])
+            self.filled += take
+            view = view[take:]
+            if self.filled == self.block_size:
+                self._close_block()
+
+    def _close_block(self):
+        self.block_digests[self.index] = self._hasher.hexdigest()
+        self.index += 1
+        self.filled = 0
+        self._hasher = hashlib.sha256()
+
+    def finish(self):
+        if self.filled:
+            self._close_block()
+
+
+def combine_block_digests(block_digests, total_size: int, block_size: int = WEBAPI_HASH_BLOCK_SIZE):
+    count = max(1, -(-int(total_size) // block_size))
+    if any(index not in block_digests for index in range(count)):
+        return ""
+    return hashlib.sha256("".join(block_digests[index] for index in range(count)).encode("ascii")).hexdigest()
+
+
+QUEUE_PERSISTED_FIELDS = (
+    "game_name",
+    "mod_id",
+    "mod_name",
+    "status",
+    "retry_count",
+    "app_id",
+    "provider",
+    "failure_detail",
+)
+
+
+QUEUE_INTERNED_FIELDS = frozenset(("game_name", "status", "app_id", "provider"))
+QUEUE_TRANSIENT_FIELDS = ("_webapi_file_path", "_webapi_content_hash", "_webapi_hcontent_file")
+QUEUE_ENTRY_FIELDS = frozenset(QUEUE_PERSISTED_FIELDS + QUEUE_TRANSIENT_FIELDS)
+
+
+class QueueEntry:
+    __slots__ = QUEUE_PERSISTED_FIELDS + QUEUE_TRANSIENT_FIELDS
+
+    def __init__(self, fields=()):
+        for key, value in dict(fields).items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        if key not in QUEUE_ENTRY_FIELDS:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key not in QUEUE_ENTRY_FIELDS:
+            raise KeyError(key)
+        if key in QUEUE_INTERNED_FIELDS and type(value) is str:
+            value = sys.intern(value)
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        delattr(self, key)
+
+    def __contains__(self, key):
+        return key in QUEUE_ENTRY_FIELDS and hasattr(self, key)
+
+    def __iter__(self):
+        return (key for key in self.__slots__ if hasattr(self, key))
+
+    def __len__(self):
+        return sum(1 for _key in self)
+
+    def __repr__(self):
+        return f"QueueEntry({self.to_dict()!r})"
+
+    def get(self, key, default=None):
+        if key not in QUEUE_ENTRY_FIELDS:
+            return default
+        return getattr(self, key, default)
+
+    def pop(self, key, default=None):
+        value = self.get(key, default)
+        if key in self:
+            delattr(self, key)
+        return value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self]
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__ if hasattr(self, key)}
+
+
+def apply_queue_mod_fields(mod: dict, fields: dict):
+    changed = {}
+    for key, value in (fields or {}).items():
+        if key == "failure_detail" and not value:
+            if key in mod:
+                mod.pop(key, None)
+                changed[key] = None
+            continue
+        if mod.get(key) != value or key not in mod:
+            mod[key] = value
+            changed[key] = value
+    return changed
+
+
+QUEUE_VIEW_FILTERS = ("All", "Queued", "Downloaded", "Failed")
+QUEUE_ORDER_SPACING = 1 << 20
+QUEUE_VIEW_SORT_KEYS = ("", "game_name", "mod_id", "mod_name", "status", "provider")
+QUEUE_VIEW_FIELDS = tuple(sort_key for sort_key in QUEUE_VIEW_SORT_KEYS if sort_key)
+
+
+def queue_status_filter(status):
+    status = str(status or "")
+    if status == "Queued":
+        return "Queued"
+    if status == "Downloaded":
+        return "Downloaded"
+    if "Failed" in status:
+        return "Failed"
+    return None
+
+
+def queue_stat_keys(status):
+    status = str(status or "")
+    keys = ["total"]
+    if status == "Queued":
+        keys.append("queued")
+    if status == "Downloaded":
+        keys.append("downloaded")
+    if "Failed" in status:
+        keys.append("failed")
+    if status == "Downloading":
+        keys.append("downloading")
+    return keys
+
+
+def queue_view_fields(mod: dict):
+    return {key: mod[key] for key in QUEUE_VIEW_FIELDS if key in mod}
+
+
+def queue_sort_value(mod: dict, sort_key: str):
+    if not sort_key:
+        return 0
+    if sort_key == "mod_id":
+        value = str(mod.get("mod_id", "")).strip()
+        if value.isdigit():
+            return (0, int(value))
+        return (1, value.lower())
+    return str(mod.get(sort_key, "")).lower()
+
+
+class SortedKeyList:
+    def __init__(self, values=(), load: int = 512):
+        self._load = max(16, int(load))
+        self._lists = []
+        self._maxes = []
+        self._offsets = None
+        self._len = 0
+        if values:
+            self.reset(values)
+
+    def reset(self, values):
+        ordered = sorted(values)
+        self._lists = [ordered[start:start + self._load] for start in range(0, len(ordered), self._load)]
+        self._maxes = [chunk[-1] for chunk in self._lists]
+        self._offsets = None
+        self._len = len(ordered)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for chunk in self._lists:
+            yield from chunk
+
+    def __reversed__(self):
+        for chunk in reversed(self._lists):
+            yield from reversed(chunk)
+
+    def add(self, value):
+        if not self._maxes:
+            self._lists.append([value])
+            self._maxes.append(value)
+        else:
+            pos = bisect_left(self._maxes, value)
+            if pos == len(self._maxes):
+                pos -= 1
+                self._lists[pos].append(value)
+                self._maxes[pos] = value
+            else:
+                insort(self._lists[pos], value)
+            chunk = self._lists[pos]
+            if len(chunk) > self._load * 2:
+                tail = chunk[self._load:]
+                del chunk[self._load:]
+                self._maxes[pos] = chunk[-1]
+                self._lists.insert(pos + 1, tail)
+                self._maxes.insert(pos + 1, tail[-1])
+        self._len += 1
+        self._offsets = None
+
+    def remove(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        chunk = self._lists[pos]
+        index = bisect_left(chunk, value)
+        if index >= len(chunk) or chunk[index] != value:
+            return False
+        del chunk[index]
+        if not chunk:
+            del self._lists[pos]
+            del self._maxes[pos]
+        elif index == len(chunk):
+            self._maxes[pos] = chunk[-1]
+        self._len -= 1
+        self._offsets = None
+        return True
+
+    def _chunk_offsets(self):
+        if self._offsets is None:
+            offsets = []
+            total = 0
+            for chunk in self._lists:
+                offsets.append(total)
+                total += len(chunk)
+            self._offsets = offsets
+        return self._offsets
+
+    def bisect_left(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._chunk_offsets()[pos] + bisect_left(self._lists[pos], value)
+
+    def bisect_right(self, value):
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._chunk_offsets()[pos] + bisect_right(self._lists[pos], value)
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedKeyList index out of range")
+        offsets = self._chunk_offsets()
+        pos = bisect_right(offsets, index) - 1
+        return self._lists[pos][index - offsets[pos]]
+
+    def islice(self, start: int, stop: int):
+        start = max(0, start)
+        stop = min(self._len, stop)
+        if start >= stop:
+            return []
+        offsets = self._chunk_offsets()
+        pos = bisect_right(offsets, start) - 1
+        index = start - offsets[pos]
+        result = []
+        remaining = stop - start
+        while remaining > 0 and pos < len(self._lists):
+            part = self._lists[pos][index:index + remaining]
+            result.extend(part)
+            remaining -= len(part)
+            pos += 1
+            index = 0
+        return result
+
+
+def regex_required_literals(pattern: str):
+    literals = []
+    current = []
+    depth = 0
+    index = 0
+
+    def close_run():
+        if current and depth == 0:
+            literals.append("".join(current))
+        current.clear()
+
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\" and index + 1 < len(pattern):
+            escaped = pattern[index + 1]
+            index += 2
+            if not escaped.isalnum():
+                current.append(escaped)
+                continue
+            close_run()
+            # Skip the operand of numeric and named escapes so its digits are not taken as literal text.
+            if escaped in "xuU":
+                width = {"x": 2, "u": 4, "U": 8}[escaped]
+                while width and index < len(pattern) and pattern[index] in "0123456789abcdefABCDEF":
+                    index += 1
+                    width -= 1
+            elif escaped == "N" and index < len(pattern) and pattern[index] == "{":
+                closing = pattern.find("}", index)
+                index = len(pattern) if closing < 0 else closing + 1
+            elif escaped.isdigit():
+                width = 2
+                while width and index < len(pattern) and pattern[index].isdigit():
+                    index += 1
+                    width -= 1
+            continue
+        if char in "*?{":
+            if current:
+                current.pop()
+            close_run()
+            if char == "{":
+                closing = pattern.find("}", index)
+                index = len(pattern) if closing < 0 else closing + 1
+            else:
+                index += 1
+            continue
+        if char == "|":
+            return []
+        if char == "[":
+            close_run()
+            index += 1
+            if index < len(pattern) and pattern[index] == "^":
+                index += 1
+            if index < len(pattern) and pattern[index] == "]":
+                index += 1
+            while index < len(pattern) and pattern[index] != "]":
+                index += 2 if pattern[index] == "\\" else 1
+            index += 1
+            continue
+        if char in "()":
+            close_run()
+            depth += 1 if char == "(" else -1
+            index += 1
+            continue
+        if char in ".^$+":
+            close_run()
+            index += 1
+            continue
+        current.append(char)
+        index += 1
+    close_run()
+    return [literal for literal in literals if literal]
+
+
+class QueueSearchIndex:
+    def __init__(self, compact_ratio: float = 1.0):
+        self.compact_ratio = float(compact_ratio)
+        self.version = 0
+        self._slots = {}
+        self._haystacks = {}
+        self._postings = None
+        self._next_slot = 0
+        self._dead_slots = 0
+        self._last_match = None
+
+    @staticmethod
+    def _haystack_for(mod: dict):
+        mod_id = str(mod.get("mod_id", ""))
+        mod_name = str(mod.get("mod_name", ""))
+        folded_id = mod_id.lower()
+        folded_name = mod_name.lower()
+        # Reuse the original string when lowering changes nothing, which is every numeric mod id.
+        return (
+            mod_id,
+            mod_name,
+            mod_id if folded_id == mod_id else folded_id,
+            mod_name if folded_name == mod_name else folded_name,
+        )
+
+    def _index_slot(self, slot: int, haystack):
+        lowered = f"{haystack[2]}\n{haystack[3]}"
+        for trigram in {lowered[start:start + 3] for start in range(len(lowered) - 2)}:
+            posting = self._postings.get(trigram)
+            if posting is None:
+                posting = self._postings[trigram] = array("I")
+            posting.append(slot)
+
+    def _compact(self):
+        live = [(self._haystacks[slot][0], self._haystacks[slot][1]) for slot in self._slots.values()]
+        self._slots = {}
+        self._haystacks = {}
+        self._postings = None
+        self._next_slot = 0
+        self._dead_slots = 0
+        for mod_id, haystack in live:
+            self._store(mod_id, haystack)
+
+    def _store(self, mod_id: str, haystack):
+        slot = self._next_slot
+        self._next_slot += 1
+        self._slots[mod_id] = slot
+        self._haystacks[slot] = (mod_id, haystack)
+        if self._postings is not None:
+            self._index_slot(slot, haystack)
+
+    def add(self, mod: dict):
+        mod_id = str(mod.get("mod_id", "")).strip()
+        haystack = self._haystack_for(mod)
+        slot = self._slots.get(mod_id)
+        if slot is not None:
+            if self._haystacks[slot][1] == haystack:
+                return
+            del self._haystacks[slot]
+            self._dead_slots += 1
+        self._store(mod_id, haystack)
+        self.version += 1
+        if self._dead_slots > max(1024, len(self._slots) * self.compact_ratio):
+            self._compact()
+
+    def discard(self, mod_id: str):
+        slot = self._slots.pop(str(mod_id), None)
+        if slot is None:
+            return
+        del self._haystacks[slot]
+        self._dead_slots += 1
+        self.version += 1
+
+    def sync(self, mods):
+        seen = set()
+        for mod in mods:
+            seen.add(str(mod.get("mod_id", "")).strip())
+            self.add(mod)
+        for mod_id in [mod_id for mod_id in self._slots if mod_id not in seen]:
+            self.discard(mod_id)
+
+    def _candidates(self, literal: str):
+        literal = literal.lower()
+        if len(literal) < 3:
+            return self._haystacks.values()
+        if self._postings is None:
+            # Trigram postings are only built once a query long enough to use them arrives.
+            self._postings = {}
+            for slot, (_mod_id, haystack) in self._haystacks.items():
+                self._index_slot(slot, haystack)
+        best = None
+        for start in range(len(literal) - 2):
+            posting = self._postings.get(literal[start:start + 3])
+            if posting is None:
+                return []
+            if best is None or len(posting) < len(best):
+                best = posting
+        return [self._haystacks[slot] for slot in best if slot in self._haystacks]
+
+    def match(self, query: str, regex_enabled: bool = False, case_sensitive: bool = False):
+        if regex_enabled:
+            flags = 0 if case_sensitive else re.IGNORECASE
+            try:
+                pattern = re.compile(query, flags)
+            except re.error:
+                return set(), True
+            literals = regex_required_literals(query)
+            candidates = self._candidates(max(literals, key=len)) if literals else self._haystacks.values()
+            return {
+                mod_id for mod_id, haystack in candidates
+                if pattern.search(haystack[0]) or pattern.search(haystack[1])
+            }, False
+
+        needle = query if case_sensitive else query.lower()
+        previous = self._last_match
+        if (
+            previous is not None
+            and previous[0] == self.version
+            and previous[1] == case_sensitive
+            and previous[2] in needle
+        ):
+            # Every item matching an extended query also matched the shorter one.
+            candidates = previous[3]
+        else:
+            candidates = self._candidates(needle)
+        offset = 0 if case_sensitive else 2
+        matched = [
+            item for item in candidates
+            if needle in item[1][offset] or needle in item[1][offset + 1]
+        ]
+        self._last_match = (self.version, case_sensitive, needle, matched)
+        return {mod_id for mod_id, _haystack in matched}, False
+
+
+class QueueViewIndex:
+    def __init__(self):
+        self._sequence = SortedKeyList()
+        self._views = {}
+        self._active_sort_key = ""
+        self._entries = {}
+        self._next_order = 0
+        self.structure_version = 0
+        self.stats = {"total": 0, "queued": 0, "downloaded": 0, "failed": 0, "downloading": 0}
+        self.search = QueueSearchIndex()
+
+    def _track(self, mod_id: str, order, fields, step: int):
+        status = fields.get("status")
+        for stat_key in queue_stat_keys(status):
+            self.stats[stat_key] += step
+        bucket = queue_status_filter(status)
+        for (filter_name, sort_key), view in self._views.items():
+            if filter_name != "All" and filter_name != bucket:
+                continue
+            item = (queue_sort_value(fields, sort_key), order, mod_id)
+            if step > 0:
+                view.add(item)
+            else:
+                view.remove(item)
+
+    def _rebuild_views(self):
+        self.stats = dict.fromkeys(self.stats, 0)
+        for order, mod in self._entries.values():
+            for stat_key in queue_stat_keys(mod.get("status")):
+                self.stats[stat_key] += 1
+        self._sequence.reset((0, order, mod_id) for mod_id, (order, _mod) in self._entries.items())
+        self._views = {}
+        self._next_order = len(self._entries) * QUEUE_ORDER_SPACING
+        self.structure_version += 1
+
+    def rebuild(self, mods):
+        self._entries = {}
+        for position, mod in enumerate(mods):
+            mod_id = str(mod.get("mod_id", "")).strip()
+            self._entries[mod_id] = (position * QUEUE_ORDER_SPACING, mod)
+        self._rebuild_views()
+        self.search.sync(mods)
+
+    def _renumber(self):
+        self._entries = {
+            item[2]: (position * QUEUE_ORDER_SPACING, self._entries[item[2]][1])
+            for position, item in enumerate(self._sequence)
+        }
+        self._rebuild_views()
+
+    def _insert_entry(self, mod_id: str, order, mod):
+        self._entries[mod_id] = (order, mod)
+        self._sequence.add((0, order, mod_id))
+        self._track(mod_id, order, mod, 1)
+
+    def _discard_entry(self, mod_id: str):
+        entry = self._entries.pop(mod_id, None)
+        if entry is None:
+            return None
+        self._sequence.remove((0, entry[0], mod_id))
+        self._track(mod_id, entry[0], entry[1], -1)
+        return entry
+
+    def add(self, mod: dict):
+        mod_id = str(mod.get("mod_id", "")).strip()
+        self._discard_entry(mod_id)
+        self._insert_entry(mod_id, self._next_order, mod)
+        self._next_order += QUEUE_ORDER_SPACING
+        self.structure_version += 1
+        self.search.add(mod)
+
+    def discard(self, mod_id: str):
+        if self._discard_entry(str(mod_id)) is None:
+            return False
+        self.structure_version += 1
+        self.search.discard(str(mod_id))
+        return True
+
+    def ordered_ids(self):
+        return [item[2] for item in self._sequence]
+
+    def filter_ids(self, filter_name: str):
+        return [
+            item[2] for item in self._sequence
+            if queue_status_filter(self._entries[item[2]][1].get("status")) == filter_name
+        ]
+
+    def verify(self, mods):
+        problems = []
+        expected = QueueViewIndex()
+        expected.rebuild(mods)
+        if self.ordered_ids() != expected.ordered_ids():
+            problems.append("queue order differs from download_queue")
+        if set(self._entries) != set(expected._entries):
+            problems.append("indexed mod ids differ from download_queue")
+        for mod_id, entry in expected._entries.items():
+            current = self._entries.get(mod_id)
+            if current is not None and current[1] is not entry[1]:
+                problems.append(f"stale index entry for {mod_id}")
+        if self.stats != expected.stats:
+            problems.append(f"stats {self.stats} != {expected.stats}")
+        for key, view in self._views.items():
+            if [(item[0], item[2]) for item in view] != [(item[0], item[2]) for item in expected._view(*key)]:
+                problems.append(f"view {key} is out of order or membership")
+        for mod in mods:
+            mod_id = str(mod.get("mod_id", "")).strip()
+            slot = self.search._slots.get(mod_id)
+            if slot is None or self.search._haystacks[slot][1] != QueueSearchIndex._haystack_for(mod):
+                problems.append(f"search index is stale for {mod_id}")
+        if len(self.search._slots) != len(mods):
+            problems.append("search index holds removed mods")
+        return problems
+
+    def _sequence_neighbor(self, mod_id: str, step: int):
+        position = self._sequence.bisect_left((0, self._entries[mod_id][0], mod_id)) + step
+        if 0 <= position < len(self._sequence):
+            return self._sequence[position][2]
+        return None
+
+    @staticmethod
+    def _order_keys_between(lower, upper, count: int):
+        if lower is None and upper is None:
+            return [position * QUEUE_ORDER_SPACING for position in range(count)]
+        if lower is None:
+            lower = upper - QUEUE_ORDER_SPACING * (count + 1)
+        if upper is None:
+            upper = lower + QUEUE_ORDER_SPACING * (count + 1)
+        gap = upper - lower
+        if gap <= count:
+            return None
+        return [lower + gap * (position + 1) // (count + 1) for position in range(count)]
+
+    def relocate(self, mod_ids, anchor_id=None, placement: str = "top"):
+        moving = sorted(
+            {str(mod_id) for mod_id in mod_ids if str(mod_id) in self._entries},
+            key=lambda mod_id: self._entries[mod_id][0],
+        )
+        if not moving or (anchor_id is not None and (anchor_id not in self._entries or anchor_id in moving)):
+            return 0
+        removed = [(mod_id, self._discard_entry(mod_id)) for mod_id in moving]
+        sequence = self._sequence
+        while True:
+            if anchor_id is None:
+                if placement == "bottom":
+                    lower, upper = (sequence[-1][1] if len(sequence) else None), None
+                else:
+                    lower, upper = None, (sequence[0][1] if len(sequence) else None)
+            else:
+                anchor_order = self._entries[anchor_id][0]
+                position = sequence.bisect_left((0, anchor_order, anchor_id))
+                if placement == "after":
+                    lower = anchor_order
+                    upper = sequence[position + 1][1] if position + 1 < len(sequence) else None
+                else:
+                    lower = sequence[position - 1][1] if position > 0 else None
+                    upper = anchor_order
+            keys = self._order_keys_between(lower, upper, len(moving))
+            if keys is not None:
+                break
+            # The gap between neighbours is exhausted; spread every key out again and retry.
+            self._renumber()
+        for (mod_id, entry), order in zip(removed, keys):
+            self._insert_entry(mod_id, order, entry[1])
+        self._next_order = max(self._next_order, keys[-1] + QUEUE_ORDER_SPACING)
+        self.structure_version += 1
+        return len(moving)
+
+    def move(self, mod_ids, direction: str):
+        selected = {str(mod_id) for mod_id in mod_ids if str(mod_id) in self._entries}
+        if direction in ("top", "bottom"):
+            return self.relocate(selected, None, direction)
+        if direction not in ("up", "down"):
+            return 0
+        runs = []
+        for mod_id in sorted(selected, key=lambda selected_id: self._entries[selected_id][0]):
+            if runs and self._sequence_neighbor(mod_id, -1) == runs[-1][1]:
+                runs[-1][1] = mod_id
+            else:
+                runs.append([mod_id, mod_id])
+        # Each run swaps places with the unselected neighbour in front of it.
+        moved = 0
+        for first_id, last_id in runs:
+            if direction == "up":
+                neighbor_id = self._sequence_neighbor(first_id, -1)
+                if neighbor_id is not None:
+                    moved += self.relocate([neighbor_id], last_id, "after")
+            else:
+                neighbor_id = self._sequence_neighbor(last_id, 1)
+                if neighbor_id is not None:
+                    moved += self.relocate([neighbor_id], first_id, "before")
+        return moved
+
+    def update(self, mod: dict, previous: dict):
+        mod_id = str(mod.get("mod_id", "")).strip()
+        entry = self._entries.get(mod_id)
+        if entry is None:
+            return
+        self.search.add(mod)
+        if queue_view_fields(mod) == previous:
+            return
+        self._track(mod_id, entry[0], previous, -1)
+        self._track(mod_id, entry[0], mod, 1)
+
+    def _view(self, filter_name: str, sort_key: str):
+        if filter_name not in QUEUE_VIEW_FILTERS:
+            filter_name = "All"
+        if sort_key not in QUEUE_VIEW_SORT_KEYS:
+            sort_key = ""
+        if filter_name == "All" and not sort_key:
+            return self._sequence
+        if sort_key != self._active_sort_key:
+            # Only orderings for the sort key in use are maintained; the rest are rebuilt when asked for.
+            self._views = {}
+            self._active_sort_key = sort_key
+        view = self._views.get((filter_name, sort_key))
+        if view is None:
+            view = self._views[(filter_name, sort_key)] = SortedKeyList([
+                (queue_sort_value(mod, sort_key), order, mod_id)
+                for mod_id, (order, mod) in self._entries.items()
+                if filter_name == "All" or queue_status_filter(mod.get("status")) == filter_name
+            ])
+        return view
+
+    def count(self, filter_name: str, sort_key: str = ""):
+        if filter_name not in QUEUE_VIEW_FILTERS or filter_name == "All":
+            return self.stats["total"]
+        return self.stats[filter_name.lower()]
+
+    def page(self, filter_name: str, sort_key: str, descending: bool, offset: int, limit: int):
+        view = self._view(filter_name, sort_key)
+        total = len(view)
+        end = min(total, offset + limit)
+        if not descending:
+            return [item[2] for item in view.islice(offset, end)]
+        # Descending order reverses the key groups but keeps ties in queue order, like a stable reverse sort.
+        result = []
+        position = offset
+        while position < end:
+            sort_value = view[total - 1 - position][0]
+            group_start = view.bisect_left((sort_value,))
+            group_end = view.bisect_right((sort_value, float("inf")))
+            start = group_start + position - (total - group_end)
+            take = min(end - position, group_end - start)
+            result.extend(item[2] for item in view.islice(start, start + take))
+            position += take
+        return result
+
+    def search_ids(self, query: str, regex_enabled: bool, case_sensitive: bool, filter_name: str, sort_key: str, descending: bool):
+        matched, regex_error = self.search.match(query, regex_enabled, case_sensitive)
+        if filter_name not in QUEUE_VIEW_FILTERS:
+            filter_name = "All"
+        if sort_key not in QUEUE_VIEW_SORT_KEYS:
+            sort_key = ""
+        entries = [
+            (mod_id, self._entries[mod_id]) for mod_id in matched
+            if mod_id in self._entries
+            and (filter_name == "All" or queue_status_filter(self._entries[mod_id][1].get("status")) == filter_name)
+        ]
+        entries.sort(key=lambda item: item[1][0])
+        if sort_key:
+            entries.sort(key=lambda item: queue_sort_value(item[1][1], sort_key), reverse=descending)
+        return [mod_id for mod_id, _entry in entries], regex_error
+
+
+def queue_view_dependencies(filter_name: str, sort_key: str, searched: bool = False):
+    fields = set()
+    if filter_name in QUEUE_VIEW_FILTERS and filter_name != "All":
+        fields.add("status")
+    if sort_key in QUEUE_VIEW_SORT_KEYS and sort_key:
+        fields.add(sort_key)
+    if searched:
+        fields.update(("mod_id", "mod_name"))
+    return frozenset(fields)
+
+
+class QueueViewCache:
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max(1, int(max_entries))
+        self._views = OrderedDict()
+
+    def get(self, key, structure_version: int):
+        view = self._views.get(key)
+        if view is None:
+            return None
+        if view["structure_version"] != structure_version:
+            del self._views[key]
+            return None
+        self._views.move_to_end(key)
+        return view
+
+    def put(self, key, view: dict):
+        self._views[key] = view
+        self._views.move_to_end(key)
+        while len(self._views) > self.max_entries:
+            self._views.popitem(last=False)
+
+    def invalidate_fields(self, fields):
+        changed = set(fields)
+        for key in [key for key, view in self._views.items() if view["dependencies"] & changed]:
+            del self._views[key]
+
+    def clear(self):
+        self._views.clear()
+
+
+class QueueJournal:
+    def __init__(self, root_dir: str, flush_delay_sec: float = 0.2, compact_threshold: int = 5000):
+        self.root_dir = root_dir
+        self.snapshot_path = os.path.join(root_dir, "queue_snapshot.json")
+        self.flush_delay_sec = flush_delay_sec
+        self.compact_threshold = max(1, int(compact_threshold))
+
+        self._lock = threading.Lock()
+        self._pending = []
+        self._flush_timer = None
+        self._file = None
+        self._generation = 0
+        self._records_since_compaction = 0
+        self._compaction_requested = False
+        self._closed = False
+
+    def _segment_path(self, generation: int):
+        return os.path.join(self.root_dir, f"queue_journal.{int(generation)}.log")
+
+    def _list_segments(self):
+        segments = []
+        if not os.path.isdir(self.root_dir):
+            return segments
+        for name in os.listdir(self.root_dir):
+            match = re.match(r"^queue_journal\.(\d+)\.log$", name)
+            if match:
+                segments.append((int(match.group(1)), os.path.join(self.root_dir, name)))
+        return sorted(segments)
+
+    def _read_snapshot(self):
+        if not os.path.isfile(self.snapshot_path):
+            return 0, []
+        with open(self.snapshot_path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if not isinstance(data, dict):
+            raise ValueError("Queue snapshot is not a JSON object.")
+        mods = data.get("mods", [])
+        return int(data.get("generation", 0) or 0), mods if isinstance(mods, list) else []
+
+    def load(self):
+        os.makedirs(self.root_dir, exist_ok=True)
+        snapshot_generation, snapshot_mods = self._read_snapshot()
+
+        present = {}
+        order = []
+        for mod in snapshot_mods:
+            if not isinstance(mod, dict):
+                continue
+            mod_id = str(mod.get("mod_id", "")).strip()
+            if not mod_id or mod_id in present:
+                continue
+            present[mod_id] = {key: mod.get(key) for key in QUEUE_PERSISTED_FIELDS if key in mod}
+            order.append(mod_id)
+
+        def materialize():
+            # Removed ids stay in `order` as tombstones; the last occurrence wins after a re-append.
+            seen = set()
+            ordered = []
+            for mod_id in reversed(order):
+                if mod_id in seen or mod_id not in present:
+                    continue
+                seen.add(mod_id)
+                ordered.append(present[mod_id])
+            ordered.reverse()
+            return ordered
+
+        order_index = None
+
+        def ordering():
+            # Moves replay against spaced order keys, so each one costs a few index updates instead of a full pass.
+            nonlocal order_index
+            if order_index is None:
+                order_index = QueueViewIndex()
+                order_index.rebuild([{"mod_id": str(mod.get("mod_id", "")).strip()} for mod in materialize()])
+            return order_index
+
+        replayed = 0
+        segments = self._list_segments()
+        for generation, path in segments:
+            if generation < snapshot_generation:
+                continue
+            with open(path, "r", encoding="utf-8", errors="replace") as file:
+                for line in file:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn trailing write from a crash; everything before it is intact.
+                        continue
+                    if not isinstance(record, dict):
+                        continue
+                    op = record.get("op")
+                    if op == "append":
+                        for mod in record.get("mods", []) or []:
+                            mod_id = str((mod or {}).get("mod_id", "")).strip()
+                            if not mod_id or mod_id in present:
+                                continue
+                            present[mod_id] = {key: mod.get(key) for key in QUEUE_PERSISTED_FIELDS if key in mod}
+                            if order_index is not None:
+                                order_index.add({"mod_id": mod_id})
+                            else:
+                                order.append(mod_id)
+                    elif op == "update":
+                        for mod_id, fields in record.get("updates", []) or []:
+                            mod = present.get(str(mod_id))
+                            if mod is not None and isinstance(fields, dict):
+                                apply_queue_mod_fields(mod, fields)
+                    elif op == "remove":
+                        for mod_id in record.get("mod_ids", []) or []:
+                            present.pop(str(mod_id), None)
+                            if order_index is not None:
+                                order_index.discard(str(mod_id))
+                    elif op == "move":
+                        ordering().move([str(mod_id) for mod_id in record.get("mod_ids") or []], record.get("direction"))
+                    elif op == "reorder":
+                        ordering().relocate(
+                            [str(mod_id) for mod_id in record.get("mod_ids") or []],
+                            str(record.get("target", "")),
+                            record.get("placement", "before"),
+                        )
+                    else:
+                        continue
+                    replayed += 1
+
+        with self._lock:
+            highest = max([snapshot_generation] + [generation for generation, _ in segments])
+            self._generation = highest + 1
+            self._file = open(self._segment_path(self._generation), "a", encoding="utf-8")
+            self._records_since_compaction = replayed
+            self._closed = False
+        if order_index is not None:
+            return [present[mod_id] for mod_id in order_index.ordered_ids() if mod_id in present], replayed
+        return materialize(), replayed
+
+    def record(self, record: dict):
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            if self._closed or self._file is None:
+                return False
+            self._pending.append(line)
+            self._records_since_compaction += 1
+            if self._flush_timer is None or not self._flush_timer.is_alive():
+                self._flush_timer = threading.Timer(self.flush_delay_sec, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+            if self._records_since_compaction >= self.compact_threshold and not self._compaction_requested:
+                self._compaction_requested = True
+                return True
+        return False
+
+    def _flush_locked(self):
+        if not self._pending or self._file is None:
+            self._pending = []
+            return
+        lines = self._pending
+        self._pending = []
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush_timer = None
+            self._flush_locked()
+
+    def rotate(self):
+        with self._lock:
+            self._flush_locked()
+            if self._file is not None:
+                try:
+                    os.fsync(self._file.fileno())
+                except OSError:
+                    pass
+                self._file.close()
+            self._generation += 1
+            self._file = open(self._segment_path(self._generation), "a", encoding="utf-8")
+            self._records_since_compaction = 0
+            self._compaction_requested = False
+            return self._generation
+
+    def write_snapshot(self, mods, generation: int):
+        temp_path = f"{self.snapshot_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"version": 1, "generation": int(generation), "mods": mods}, file, ensure_ascii=False)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        for segment_generation, path in self._list_segments():
+            if segment_generation < generation:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def close(self):
+        with self._lock:
+            timer = self._flush_timer
+            self._flush_timer = None
+            try:
+                self._flush_locked()
+                if self._file is not None:
+                    os.fsync(self._file.fileno())
+                    self._file.close()
+            except Exception:
+                pass
+            self._file = None
+            self._closed = True
+        if timer is not None:
+            try:
+                timer.cancel()
+            except Exception:
+                pass
+
+
+class EventRingBuffer:
+    def __init__(self, capacity: int = 3000):
+        self.capacity = max(1, int(capacity))
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._events = deque(maxlen=self.capacity)
+        self._last_id = 0
+        self._closed = False
+
+    def append(self, event_type: str, payload: dict):
+        with self._lock:
+            self._last_id += 1
+            event = {
+                "id": self._last_id,
+                "type": event_type,
+                "payload": payload,
+                "timestamp": time.time(),
+            }
+            self._events.append(event)
+            self._changed.notify_all()
+            return event
+
+    def wait(self, last_event_id: int, timeout=None):
+        with self._lock:
+            if self._last_id <= int(last_event_id or 0) and not self._closed:
+                self._changed.wait_for(
+                    lambda: self._closed or self._last_id > int(last_event_id or 0),
+                    timeout=timeout,
+                )
+            return self._last_id > int(last_event_id or 0)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._changed.notify_all()
+
+    def since(self, last_event_id: int):
+        with self._lock:
+            last_id = self._last_id
+            first_id = last_id - len(self._events) + 1
+            cursor = max(0, min(int(last_event_id or 0), last_id))
+            new_count = last_id - max(cursor, first_id - 1)
+            events = list(islice(reversed(self._events), new_count))
+        events.reverse()
+        if cursor < first_id - 1:
+            events.insert(0, {
+                "id": first_id - 1,
+                "type": "gap",
+                "payload": {"missed_from": cursor + 1, "missed_to": first_id - 1},
+                "timestamp": time.time(),
+            })
+        return events
+
+    @property
+    def last_id(self):
+        with self._lock:
+            return self._last_id
+
+
+class MetadataCacheStore:
+    def __init__(self, path: str, ttl_sec: float, max_entries: int = 200000):
+        self.path = path
+        self.ttl_sec = float(ttl_sec)
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def open(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS mod_metadata ("
+            "mod_id TEXT PRIMARY KEY, mod_name TEXT, app_id TEXT, game_name TEXT, "
+            "ts REAL NOT NULL, accessed_at REAL NOT NULL) WITHOUT ROWID"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS mod_metadata_ts ON mod_metadata (ts)")
+        conn.execute("CREATE INDEX IF NOT EXISTS mod_metadata_accessed_at ON mod_metadata (accessed_at)")
+        with self._lock:
+            self._conn = conn
+
+    def get(self, mod_id: str):
+        with self._lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT mod_name, app_id, game_name, ts FROM mod_metadata WHERE mod_id = ?",
+                (str(mod_id),),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"mod_name": row[0], "app_id": row[1], "game_name": row[2], "ts": row[3]}
+
+    def write(self, payloads: dict, touched_at: dict):
+        if not payloads and not touched_at:
+            return
+        now = time.time()
+        rows = [
+            (
+                str(mod_id),
+                payload.get("mod_name"),
+                payload.get("app_id"),
+                payload.get("game_name"),
+                float(payload.get("ts", now) or now),
+                float(touched_at.get(mod_id, now)),
+            )
+            for mod_id, payload in payloads.items()
+        ]
+        touches = [(float(ts), str(mod_id)) for mod_id, ts in touched_at.items() if mod_id not in payloads]
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.execute("BEGIN")
+            try:
+                if rows:
+                    self._conn.executemany(
+                        "INSERT INTO mod_metadata (mod_id, mod_name, app_id, game_name, ts, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(mod_id) DO UPDATE SET "
+                        "mod_name = excluded.mod_name, app_id = excluded.app_id, game_name = excluded.game_name, "
+                        "ts = excluded.ts, accessed_at = excluded.accessed_at",
+                        rows,
+                    )
+                if touches:
+                    self._conn.executemany("UPDATE mod_metadata SET accessed_at = ? WHERE mod_id = ?", touches)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def evict(self):
+        with self._lock:
+            if self._conn is None:
+                return 0
+            removed = self._conn.execute(
+                "DELETE FROM mod_metadata WHERE ts < ?",
+                (time.time() - self.ttl_sec,),
+            ).rowcount
+            total = self._conn.execute("SELECT COUNT(*) FROM mod_metadata").fetchone()[0]
+            overflow = total - self.max_entries
+            if overflow > 0:
+                removed += self._conn.execute(
+                    "DELETE FROM mod_metadata WHERE mod_id IN "
+                    "(SELECT mod_id FROM mod_metadata ORDER BY accessed_at LIMIT ?)",
+                    (overflow,),
+                ).rowcount
+            return max(0, removed)
+
+    def close(self):
+        with self._lock:
+            conn = self._conn
+            self._conn = None
+        if conn is not None:
+            try:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except Exception:
+                pass
+            conn.close()
+
+
+class CachedHttpResponse:
+    def __init__(self, url: str, status_code: int, text: str, from_cache: bool = False):
+        self.url = url
+        self.status_code = int(status_code)
+        self.text = text
+        self.from_cache = bool(from_cache)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+class HttpResponseCache:
+    def __init__(self, path: str, max_bytes: int = 64 << 20):
+        self.path = path
+        self.max_bytes = max(1, int(max_bytes))
+        self._lock = threading.Lock()
+        self._conn = None
+        self._total_bytes = 0
+
+    def open(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache ("
+            "url TEXT PRIMARY KEY, final_url TEXT, etag TEXT, last_modified TEXT, body BLOB, "
+            "size INTEGER NOT NULL, fetched_at REAL NOT NULL, accessed_at REAL NOT NULL) WITHOUT ROWID"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS http_cache_accessed_at ON http_cache (accessed_at)")
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        with self._lock:
+            self._conn = conn
+            self._total_bytes = int(total)
+
+    def get(self, url: str):
+        with self._lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT final_url, etag, last_modified, body, fetched_at FROM http_cache WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE http_cache SET accessed_at = ? WHERE url = ?", (time.time(), url))
+        try:
+            text = zlib.decompress(row[3]).decode("utf-8")
+        except Exception:
+            return None
+        return {"final_url": row[0], "etag": row[1], "last_modified": row[2], "text": text, "fetched_at": row[4]}
+
+    def put(self, url: str, final_url: str, etag: str, last_modified: str, text: str):
+        body = zlib.compress(str(text or "").encode("utf-8"), 6)
+        now = time.time()
+        with self._lock:
+            if self._conn is None:
+                return
+            previous = self._conn.execute("SELECT size FROM http_cache WHERE url = ?", (url,)).fetchone()
+            self._conn.execute(
+                "INSERT INTO http_cache (url, final_url, etag, last_modified, body, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT(url) DO UPDATE SET "
+                "final_url = excluded.final_url, etag = excluded.etag, last_modified = excluded.last_modified, "
+                "body = excluded.body, size = excluded.size, fetched_at = excluded.fetched_at, "
+                "accessed_at = excluded.accessed_at",
+                (url, final_url, etag or "", last_modified or "", body, len(body), now, now),
+            )
+            self._total_bytes += len(body) - (previous[0] if previous else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict_locked()
+
+    def touch(self, url: str):
+        now = time.time()
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.execute("UPDATE http_cache SET fetched_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+
+    def _evict_locked(self):
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute("SELECT url, size FROM http_cache ORDER BY accessed_at").fetchall()
+        victims = []
+        for url, size in rows:
+            if self._total_bytes <= target:
+                break
+            victims.append((url,))
+            self._total_bytes -= int(size)
+        if victims:
+            self._conn.executemany("DELETE FROM http_cache WHERE url = ?", victims)
+
+    def close(self):
+        with self._lock:
+            conn = self._conn
+            self._conn = None
+        if conn is not None:
+            try:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except Exception:
+                pass
+            conn.close()
+
+
+class AdaptiveHostLimiter:
+    THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+    def __init__(
+        self,
+        rate_per_sec: float = 10.0,
+        min_rate_per_sec: float = 1.0,
+        max_rate_per_sec: float = 40.0,
+        burst: int = 8,
+        concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        target_latency_sec: float = 3.0,
+        decrease_factor: float = 0.5,
+        cooldown_sec: float = 1.0,
+    ):
+        self.min_rate_per_sec = max(0.1, float(min_rate_per_sec))
+        self.max_rate_per_sec = max(self.min_rate_per_sec, float(max_rate_per_sec))
+        self.min_concurrency = max(1, int(min_concurrency))
+        self.max_concurrency = max(self.min_concurrency, int(max_concurrency))
+        self.burst = max(1, int(burst))
+        self.target_latency_sec = float(target_latency_sec)
+        self.decrease_factor = min(0.95, max(0.05, float(decrease_factor)))
+        self.cooldown_sec = max(0.0, float(cooldown_sec))
+
+        self._cond = threading.Condition()
+        self._rate = min(self.max_rate_per_sec, max(self.min_rate_per_sec, float(rate_per_sec)))
+        self._limit = float(min(self.max_concurrency, max(self.min_concurrency, int(concurrency))))
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._last_decrease_at = 0.0
+        self._throttled = 0
+        self._completed = 0
+
+    def _refill_locked(self, now: float):
+        elapsed = max(0.0, now - self._last_refill)
+        self._last_refill = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self._rate)
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill_locked(now)
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._in_flight >= int(self._limit):
+                    wait = 0.5
+                elif self._tokens < 1.0:
+                    wait = (1.0 - self._tokens) / self._rate
+                else:
+                    self._tokens -= 1.0
+                    self._in_flight += 1
+                    return now
+                self._cond.wait(max(0.005, min(wait, 1.0)))
+
+    def _decrease_locked(self, now: float):
+        # One multiplicative cut per cooldown window, so a burst of 429s from
+        # requests that were already in flight does not collapse the limit to the floor.
+        if now - self._last_decrease_at < self.cooldown_sec:
+            return
+        self._last_decrease_at = now
+        self._limit = max(float(self.min_concurrency), self._limit * self.decrease_factor)
+        self._rate = max(self.min_rate_per_sec, self._rate * self.decrease_factor)
+        self._tokens = min(self._tokens, 1.0)
+
+    def release(self, status_code=None, latency_sec=None, error=False, retry_after_sec=0.0):
+        with self._cond:
+            now = time.monotonic()
+            self._in_flight = max(0, self._in_flight - 1)
+            self._completed += 1
+            status = int(status_code or 0)
+            if error or status in self.THROTTLE_STATUS_CODES or status >= 500:
+                if status in self.THROTTLE_STATUS_CODES:
+                    self._throttled += 1
+                self._decrease_locked(now)
+                if retry_after_sec and retry_after_sec > 0:
+                    self._blocked_until = max(self._blocked_until, now + min(60.0, float(retry_after_sec)))
+            elif latency_sec is not None and latency_sec > self.target_latency_sec:
+                self._decrease_locked(now)
+            else:
+                # Additive increase: roughly one extra slot and one request/sec per window of successes.
+                self._limit = min(float(self.max_concurrency), self._limit + 1.0 / max(1.0, self._limit))
+                self._rate = min(self.max_rate_per_sec, self._rate + 1.0 / max(1.0, self._limit))
+            self._cond.notify_all()
+
+    def snapshot(self):
+        with self._cond:
+            return {
+                "rate_per_sec": round(self._rate, 2),
+                "concurrency_limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "throttled": self._throttled,
+                "completed": self._completed,
+                "blocked_for_sec": round(max(0.0, self._blocked_until - time.monotonic()), 2),
+            }
+
+
+class SteamHttpClient:
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        pool_sizes=None,
+        default_pool_size: int = 8,
+        max_retries: int = 2,
+        backoff_base_sec: float = 0.35,
+        backoff_max_sec: float = 8.0,
+        user_agent: str = "Mozilla/5.0",
+        host_limiters=None,
+    ):
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_base_sec = float(backoff_base_sec)
+        self.backoff_max_sec = float(backoff_max_sec)
+        self.pool_sizes = {str(host).lower(): max(1, int(size)) for host, size in (pool_sizes or {}).items()}
+        self.default_pool_size = max(1, int(default_pool_size))
+        self.host_limiters = {str(host).lower(): limiter for host, limiter in (host_limiters or {}).items()}
+
+        self._stats_lock = threading.Lock()
+        self._host_stats = {}
+        self._adapters = {}
+        self._session = requests.Session()
+        self._session.headers.update({
+            "User-Agent": user_agent,
+            "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING,
+            "Connection": "keep-alive",
+        })
+
+        default_adapter = requests.adapters.HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=self.default_pool_size,
+            max_retries=0,
+        )
+        self._session.mount("https://", default_adapter)
+        self._session.mount("http://", default_adapter)
+        self._adapters["*"] = default_adapter
+        for host, size in self.pool_sizes.items():
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=0)
+            self._session.mount(f"https://{host}/", adapter)
+            self._adapters[host] = adapter
+
+    def _host_for_url(self, url: str):
+        match = re.match(r"^[a-z]+://([^/:?#]+)", str(url or ""), flags=re.IGNORECASE)
+        return match.group(1).lower() if match else ""
+
+    def _record(self, host: str, key: str, amount: int = 1):
+        with self._stats_lock:
+            stats = self._host_stats.setdefault(host, {"requests": 0, "retries": 0, "errors": 0})
+            stats[key] = stats.get(key, 0) + amount
+
+    def _retry_after_sec(self, response):
+        if response is None:
+            return 0.0
+        try:
+            return max(0.0, float(response.headers.get("Retry-After", 0) or 0))
+        except (TypeError, ValueError):
+            return 0.0
+
+    def _retry_delay(self, attempt: int, response=None):
+        delay = self.backoff_base_sec * (2 ** attempt)
+        delay = max(delay, self._retry_after_sec(response))
+        return min(self.backoff_max_sec, delay)
+
+    def request(self, method: str, url: str, retries=None, timeout=30, **kwargs):
+        host = self._host_for_url(url)
+        limiter = self.host_limiters.get(host)
+        attempts = 1 + (self.max_retries if retries is None else max(0, int(retries)))
+        for attempt in range(attempts):
+            self._record(host, "requests")
+            started_at = limiter.acquire() if limiter is not None else time.monotonic()
+            try:
+                response = self._session.request(method, url, timeout=timeout, **kwargs)
+            except (requests.Timeout, requests.ConnectionError):
+                if limiter is not None:
+                    limiter.release(error=True)
+                self._record(host, "errors")
+                if attempt >= attempts - 1:
+                    raise
+                self._record(host, "retries")
+                time.sleep(self._retry_delay(attempt))
+                continue
+            except Exception:
+                if limiter is not None:
+                    limiter.release()
+                raise
+            if limiter is not None:
+                limiter.release(
+                    status_code=response.status_code,
+                    latency_sec=time.monotonic() - started_at,
+                    retry_after_sec=self._retry_after_sec(response),
+                )
+            if response.status_code in self.RETRYABLE_STATUS_CODES and attempt < attempts - 1:
+                self._record(host, "retries")
+                delay = self._retry_delay(attempt, response)
+                response.close()
+                time.sleep(delay)
+                continue
+            return response
+        raise RuntimeError(f"Request to {url} failed.")
+
+    def get(self, url: str, **kwargs):
+        kwargs.setdefault("allow_redirects", True)
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def stats(self):
+        with self._stats_lock:
+            host_stats = {host: dict(values) for host, values in self._host_stats.items()}
+        pools = {}
+        for name, adapter in self._adapters.items():
+            try:
+                pool_manager = adapter.poolmanager
+                for key in list(pool_manager.pools.keys()):
+                    pool = pool_manager.pools.get(key)
+                    if pool is None:
+                        continue
+                    pools[str(pool.host)] = {
+                        "adapter": name,
+                        "max_size": int(getattr(pool.pool, "maxsize", 0) or 0),
+                        "idle": int(pool.pool.qsize()) if pool.pool is not None else 0,
+                        "connections_opened": int(getattr(pool, "num_connections", 0) or 0),
+                        "requests_served": int(getattr(pool, "num_requests", 0) or 0),
+                    }
+            except Exception:
+                continue
+        limiters = {host: limiter.snapshot() for host, limiter in self.host_limiters.items()}
+        return {"hosts": host_stats, "pools": pools, "limiters": limiters}
+
+    def close(self):
+        try:
+            self._session.close()
+        except Exception:
+            pass
+
+
 class AppIDScraper:
     def __init__(self, files_dir):
         self.files_dir = files_dir
@@ -311,6 +1968,7 @@ class StreamlineWebBackend:
         self.steamcmd_download_path = os.path.join(self.downloads_root, "SteamCMD")
         self.steamwebapi_download_path = os.path.join(self.downloads_root, "SteamWebAPI")
         self.mod_log_path = os.path.join(self.files_dir, "Logs", "mod_downloads.json")
+        self.queue_store_dir = os.path.join(self.files_dir, "Queue")
 
         os.makedirs(self.files_dir, exist_ok=True)
         os.makedirs(self.downloads_root, exist_ok=True)
@@ -319,9 +1977,20 @@ class StreamlineWebBackend:
         os.makedirs(os.path.dirname(self.mod_log_path), exist_ok=True)
 
         self.state_lock = threading.RLock()
-        self.events_lock = threading.Lock()
-        self.events = []
-        self.event_id = 0
+        self._event_buffer_capacity = 3000
+        self.events = EventRingBuffer(self._event_buffer_capacity)
+        self._event_sink_lock = threading.Lock()
+        self._event_sink = None
+        self._event_sink_cursor = 0
+        self._event_push_thread = None
+        self._event_push_interval_sec = 0.016
+        self._event_push_retry_sec = 0.25
+        self._event_push_retry_max_sec = 2.0
+        self._event_long_poll_max_sec = 30.0
+        self._status_batch_lock = threading.Lock()
+        self._status_batch_pending = {}
+        self._status_batch_timer = None
+        self._status_batch_interval_sec = 0.05
         self._config_save_lock = threading.Lock()
         self._config_save_timer = None
         self._config_dirty = False
@@ -334,14 +2003,16 @@ class StreamlineWebBackend:
         self._mod_logs_save_timer = None
         self._mod_logs_dirty = False
         self._mod_logs_save_delay_sec = 0.5
-        self._queue_revision = 0
-        self._queue_query_cache = None
+        self._queue_views = QueueViewCache()
+        self._queue_last_view = None
         self._queue_emit_lock = threading.Lock()
         self._queue_emit_timer = None
         self._queue_emit_interval_sec = 0.6
         self._queue_emit_last_at = 0.0
         self._queue_build_lock = threading.Lock()
         self._queue_build_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="queue-build")
+        self._queue_journal = QueueJournal(self.queue_store_dir)
+        self._queue_compaction_lock = threading.Lock()
         self._operation_lock = threading.Lock()
         self._operation_seq = 0
         self._active_download_operation_id = ""
@@ -353,30 +2024,93 @@ class StreamlineWebBackend:
         self._active_download_last_progress_key = ""
         self._download_progress_log_interval_sec = 1.2
         self._download_max_retries = 3
-
-        self._metadata_cache_path = None
+        self._webapi_resume_min_bytes = 1 << 20
+        self._webapi_segment_min_bytes = 64 << 20
+        self._webapi_segment_target_bytes = 32 << 20
+        self._webapi_max_segments = 8
+        self._webapi_connection_budget = threading.BoundedSemaphore(12)
+        self._webapi_store_dir = os.path.join(self.files_dir, "Cache", "webapi_store")
+
+        self._metadata_cache_path = os.path.join(self.files_dir, "Cache", "mod_metadata.sqlite3")
         self._metadata_cache_lock = threading.Lock()
         self._metadata_cache = {}
+        self._metadata_cache_memory_entries = 20000
+        self._metadata_cache_pending = {}
+        self._metadata_cache_touched = {}
         self._metadata_cache_dirty = False
         self._metadata_cache_save_timer = None
         self._metadata_cache_save_delay_sec = 0.8
         self._metadata_cache_ttl_sec = 60 * 60 * 24 * 14
+        self._metadata_cache_store = MetadataCacheStore(self._metadata_cache_path, self._metadata_cache_ttl_sec)
         self._hydration_lock = threading.Lock()
         self._hydration_inflight = set()
-        self._hydration_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mod-hydrate")
-        self._workshop_ui_cache = {}
+        self._hydration_pending = {}
+        self._hydration_drainers = 0
+        self._hydration_batch_size = 100
+        self._hydration_coalesce_sec = 0.15
+        self._hydration_workers = 8
+        self._hydration_executor = ThreadPoolExecutor(max_workers=self._hydration_workers, thread_name_prefix="mod-hydrate")
+        self._workshop_ui_cache = OrderedDict()
+        self._workshop_ui_cache_limit = 512
+        self._workshop_ui_cache_lock = threading.Lock()
+        self._http_cache = HttpResponseCache(os.path.join(self.files_dir, "Cache", "http_cache.sqlite3"), 64 << 20)
+        self._http_cache_ttl_sec = {
+            "workshop_mode": 7 * 24 * 60 * 60,
+            "collection": 10 * 60,
+            "item": 60 * 60,
+        }
+        self._workshop_page_concurrency = 24
+        self._collection_expand_workers = 4
+        self._collection_details_chunk_size = 100
+        self._webapi_download_workers = 6
+        self.http = SteamHttpClient(
+            pool_sizes={
+                "steamcommunity.com": self._workshop_page_concurrency + self._hydration_workers + 4,
+                "api.steampowered.com": self._hydration_workers + self._webapi_download_workers + self._collection_expand_workers + 2,
+            },
+            default_pool_size=self._webapi_download_workers + 2,
+            host_limiters={
+                "steamcommunity.com": AdaptiveHostLimiter(
+                    rate_per_sec=16.0,
+                    max_rate_per_sec=48.0,
+                    burst=self._workshop_page_concurrency,
+                    concurrency=16,
+                    max_concurrency=self._workshop_page_concurrency + self._hydration_workers,
+                ),
+                "api.steampowered.com": AdaptiveHostLimiter(
+                    rate_per_sec=8.0,
+                    max_rate_per_sec=24.0,
+                    burst=8,
+                    concurrency=6,
+                    max_concurrency=self._hydration_workers + self._webapi_download_workers,
+                ),
+            },
+        )
 
         self.config = self._load_config()
         self.app_ids = {}
         self._load_app_ids()
         self._load_mod_metadata_cache()
+        self._load_http_cache()
 
         self.download_queue = []
         self._queue_mod_ids = set()
+        self._queue_index = QueueViewIndex()
+        self._verify_queue_indexes = os.environ.get("STREAMLINE_VERIFY_QUEUE_INDEXES", "") == "1"
         self._queue_mod_map = {}
+        self._restore_persisted_queue()
         self.is_downloading = False
         self.canceled = False
-        self.current_process = None
+        self.steamcmd_processes = set()
+        self._steamcmd_max_instances = 8
+        self._steamcmd_workers = {}
+        self._steamcmd_live_workers = set()
+        self._steamcmd_idle_timer = None
+        self._steamcmd_worker_recycle_items = 200
+        self._steamcmd_worker_idle_sec = 600.0
+        self._steamcmd_item_timeout_sec = 600.0
+        self._move_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="steamcmd-move")
+        self._move_progress_log_interval_sec = 1.0
         self._download_worker_thread = None
         self.successful_downloads_this_session = set()
         self.session_steamcmd_downloads = set()
@@ -399,19 +2133,10 @@ class StreamlineWebBackend:
         self.log("Web backend initialized.", tone="good", source="system", action="initialized")
 
     def _emit_event(self, event_type: str, payload: dict):
-        if event_type == "queue":
-            with self.state_lock:
-                self._queue_revision += 1
-        with self.events_lock:
-            self.event_id += 1
-            self.events.append({
-                "id": self.event_id,
-                "type": event_type,
-                "payload": payload,
-                "timestamp": time.time()
-            })
-            if len(self.events) > 3000:
-                self.events = self.events[-1500:]
+        if event_type in ("queue", "download"):
+            # Status deltas must reach the UI before the refresh or run-state change that follows them.
+            self._flush_queue_status_batch()
+        self.events.append(event_type, payload)
 
     def _emit_queue_refresh_throttled(self, force=False):
         if self._shutting_down:
@@ -446,9 +2171,53 @@ class StreamlineWebBackend:
         if immediate:
             self._emit_event("queue", {"action": "refresh"})
 
-    def poll_events(self, last_event_id: int):
-        with self.events_lock:
-            return [evt for evt in self.events if evt["id"] > int(last_event_id)]
+    def poll_events(self, last_event_id: int, timeout_sec=0):
+        try:
+            timeout = min(max(0.0, float(timeout_sec or 0)), self._event_long_poll_max_sec)
+        except (TypeError, ValueError):
+            timeout = 0.0
+        if timeout > 0 and not self._shutting_down:
+            self.events.wait(last_event_id, timeout=timeout)
+        return self.events.since(last_event_id)
+
+    def set_event_sink(self, sink, last_event_id: int = 0):
+        with self._event_sink_lock:
+            self._event_sink = sink
+            self._event_sink_cursor = max(0, int(last_event_id or 0))
+            if sink is None or self._shutting_down:
+                return
+            if self._event_push_thread is not None and self._event_push_thread.is_alive():
+                return
+            self._event_push_thread = threading.Thread(target=self._event_push_loop, name="event-push", daemon=True)
+            self._event_push_thread.start()
+
+    def _event_push_loop(self):
+        failures = 0
+        while not self._shutting_down:
+            with self._event_sink_lock:
+                sink = self._event_sink
+                cursor = self._event_sink_cursor
+            if sink is None:
+                return
+            if not self.events.wait(cursor, timeout=1.0):
+                continue
+            time.sleep(self._event_push_interval_sec)
+            events = self.events.since(cursor)
+            if not events:
+                continue
+            try:
+                delivered = sink(events) is not False
+            except Exception:
+                delivered = False
+            if not delivered:
+                failures += 1
+                time.sleep(min(self._event_push_retry_max_sec, self._event_push_retry_sec * (2 ** min(failures - 1, 8))))
+                continue
+            failures = 0
+            with self._event_sink_lock:
+                if self._event_sink is not sink:
+                    continue
+                self._event_sink_cursor = max(self._event_sink_cursor, events[-1]["id"])
 
     def _next_operation_id(self, prefix: str = "op"):
         key = re.sub(r"[^a-z0-9]+", "-", str(prefix or "op").lower()).strip("-") or "op"
@@ -564,22 +2333,149 @@ class StreamlineWebBackend:
                     game_name, app_id = line.rsplit(",", 1)
                     self.app_ids[app_id.strip()] = game_name.strip()
         except Exception as e:
-            self.log(f"Failed to load AppIDs.txt: {e}", tone="bad", source="system", action="appids_load_failed")
+            self.log(f"Failed to load AppIDs.txt: {e}", tone="bad", source="system", action="appids_load_failed")
+
+    @property
+    def download_queue(self):
+        queue = self._download_queue
+        if queue is None:
+            # Reorders only touch the order index; the flat list is rebuilt on the next full read.
+            queue = [self._queue_mod_map[mod_id] for mod_id in self._queue_index.ordered_ids()]
+            self._download_queue = queue
+        return queue
+
+    @download_queue.setter
+    def download_queue(self, mods):
+        self._download_queue = list(mods)
+
+    def _rebuild_queue_indexes_locked(self):
+        mod_ids = set()
+        mod_map = {}
+        deduped = []
+        for mod in self.download_queue:
+            mod_id = str(mod.get("mod_id", "")).strip()
+            if not mod_id or mod_id in mod_ids:
+                continue
+            mod_ids.add(mod_id)
+            mod_map[mod_id] = mod
+            deduped.append(mod)
+        self.download_queue = deduped
+        self._queue_mod_ids = mod_ids
+        self._queue_mod_map = mod_map
+        self._queue_index.rebuild(deduped)
+
+    def _persisted_queue_mod(self, mod):
+        return {key: mod.get(key) for key in QUEUE_PERSISTED_FIELDS if key in mod}
+
+    def _journal_queue_locked(self, record: dict):
+        if self._verify_queue_indexes:
+            self._verify_queue_indexes_locked(record.get("op", ""))
+        try:
+            compaction_due = self._queue_journal.record(record)
+        except Exception:
+            return
+        if compaction_due:
+            self._schedule_queue_compaction()
+
+    def _verify_queue_indexes_locked(self, operation: str = ""):
+        queue = self.download_queue
+        problems = []
+        mod_ids = [str(mod.get("mod_id", "")).strip() for mod in queue]
+        if len(set(mod_ids)) != len(mod_ids):
+            problems.append("download_queue contains duplicate mod ids")
+        if set(self._queue_mod_map) != set(mod_ids) or self._queue_mod_ids != set(mod_ids):
+            problems.append("queue id map or id set differs from download_queue")
+        elif any(self._queue_mod_map[mod_id] is not mod for mod_id, mod in zip(mod_ids, queue)):
+            problems.append("queue id map points at replaced entries")
+        problems.extend(self._queue_index.verify(queue))
+        if problems:
+            raise AssertionError(f"Queue indexes are inconsistent after '{operation}': " + "; ".join(problems))
+
+    def _remove_queue_mods_locked(self, mod_ids):
+        removed = []
+        for mod_id in mod_ids:
+            key = str(mod_id or "").strip()
+            if self._queue_mod_map.pop(key, None) is None:
+                continue
+            self._queue_mod_ids.discard(key)
+            self._queue_index.discard(key)
+            removed.append(key)
+        if removed:
+            self._download_queue = None
+        return removed
+
+    def _update_queue_mod_fields_locked(self, mod, fields: dict):
+        previous = queue_view_fields(mod)
+        changed = apply_queue_mod_fields(mod, fields)
+        if not changed:
+            return changed
+        mod_id = str(mod.get("mod_id", "")).strip()
+        if mod_id and self._queue_mod_map.get(mod_id) is mod:
+            self._queue_index.update(mod, previous)
+            self._queue_views.invalidate_fields(changed)
+            persisted = {key: value for key, value in changed.items() if key in QUEUE_PERSISTED_FIELDS}
+            if persisted:
+                self._journal_queue_locked({"op": "update", "updates": [[mod_id, persisted]]})
+        return changed
+
+    def _restore_persisted_queue(self):
+        try:
+            mods, replayed = self._queue_journal.load()
+        except Exception as e:
+            self.log(
+                f"Failed to restore the saved download queue: {e}",
+                tone="bad",
+                source="system",
+                action="queue_restore_failed",
+                context={"error": str(e), "queue_store_dir": self.queue_store_dir},
+            )
+            return
+        for mod in mods:
+            # Anything in flight when the previous session ended has to be downloaded again.
+            if mod.get("status") == "Downloading":
+                mod["status"] = "Queued"
+            mod.setdefault("retry_count", 0)
+            mod.setdefault("provider", "Default")
+        with self.state_lock:
+            self.download_queue = [QueueEntry(mod) for mod in mods]
+            self._rebuild_queue_indexes_locked()
+            restored = len(self.download_queue)
+        if replayed:
+            self._schedule_queue_compaction()
+        if restored:
+            self.log(
+                f"Restored {restored:,} queued item(s) from the previous session.",
+                source="system",
+                action="queue_restored",
+                context={"restored": restored, "journal_records": replayed},
+            )
+
+    def _compact_queue_journal(self, wait=False):
+        if not self._queue_compaction_lock.acquire(blocking=bool(wait)):
+            return False
+        try:
+            with self.state_lock:
+                generation = self._queue_journal.rotate()
+                snapshot = [self._persisted_queue_mod(mod) for mod in self.download_queue]
+            self._queue_journal.write_snapshot(snapshot, generation)
+            return True
+        except Exception as e:
+            self.log(
+                f"Failed to compact the queue journal: {e}",
+                tone="warn",
+                source="system",
+                action="queue_journal_compaction_failed",
+                context={"error": str(e)},
+            )
+            return False
+        finally:
+            self._queue_compaction_lock.release()
 
-    def _rebuild_queue_indexes_locked(self):
-        mod_ids = set()
-        mod_map = {}
-        deduped = []
-        for mod in self.download_queue:
-            mod_id = str(mod.get("mod_id", "")).strip()
-            if not mod_id or mod_id in mod_ids:
-                continue
-            mod_ids.add(mod_id)
-            mod_map[mod_id] = mod
-            deduped.append(mod)
-        self.download_queue = deduped
-        self._queue_mod_ids = mod_ids
-        self._queue_mod_map = mod_map
+    def _schedule_queue_compaction(self):
+        if self._shutting_down:
+            return
+        worker = threading.Thread(target=self._compact_queue_journal, name="queue-journal-compact", daemon=True)
+        worker.start()
 
     def _mod_name_needs_hydration(self, mod_name: str, mod_id: str):
         normalized = str(mod_name or "").strip().lower()
@@ -617,53 +2513,108 @@ class StreamlineWebBackend:
         }
 
     def _load_mod_metadata_cache(self):
+        with self._metadata_cache_lock:
+            self._metadata_cache = {}
+            self._metadata_cache_pending = {}
+            self._metadata_cache_touched = {}
+            self._metadata_cache_dirty = False
+            self._metadata_cache_save_timer = None
         if not self._metadata_cache_path:
-            with self._metadata_cache_lock:
-                self._metadata_cache = {}
-                self._metadata_cache_dirty = False
-                self._metadata_cache_save_timer = None
             return
-        loaded = {}
-        if os.path.isfile(self._metadata_cache_path):
+        try:
+            self._metadata_cache_store.open()
+            self._metadata_cache_store.evict()
+        except Exception as e:
+            self._metadata_cache_store.close()
+            self._metadata_cache_path = None
+            self.log(
+                f"Failed to load metadata cache: {e}",
+                tone="bad",
+                source="system",
+                action="metadata_cache_load_failed",
+            )
+
+    def _load_http_cache(self):
+        try:
+            self._http_cache.open()
+        except Exception as e:
+            self._http_cache.close()
+            self.log(
+                f"Failed to load HTTP cache: {e}",
+                tone="warn",
+                source="system",
+                action="http_cache_load_failed",
+            )
+
+    def _cached_get(self, url: str, resource: str, params=None, timeout=30):
+        if params:
+            url = requests.Request("GET", url, params=params).prepare().url
+        try:
+            cached = self._http_cache.get(url)
+        except Exception:
+            cached = None
+        if cached and time.time() - float(cached.get("fetched_at") or 0) < self._http_cache_ttl_sec.get(resource, 0):
+            return CachedHttpResponse(cached.get("final_url") or url, 200, cached["text"], from_cache=True)
+
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        response = self.http.get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304 and cached:
+            response.close()
             try:
-                with open(self._metadata_cache_path, "r", encoding="utf-8") as file:
-                    data = json.load(file)
-                if isinstance(data, dict):
-                    for mod_id, payload in data.items():
-                        normalized = self._normalize_cached_mod_metadata(mod_id, payload)
-                        if normalized:
-                            loaded[str(mod_id)] = normalized
-            except Exception as e:
-                self.log(
-                    f"Failed to load metadata cache: {e}",
-                    tone="bad",
-                    source="system",
-                    action="metadata_cache_load_failed",
+                self._http_cache.touch(url)
+            except Exception:
+                pass
+            return CachedHttpResponse(cached.get("final_url") or url, 200, cached["text"], from_cache=True)
+
+        text = response.text
+        if response.status_code == 200 and "error_ctn" not in text:
+            try:
+                self._http_cache.put(
+                    url,
+                    response.url,
+                    response.headers.get("ETag", ""),
+                    response.headers.get("Last-Modified", ""),
+                    text,
                 )
-        with self._metadata_cache_lock:
-            self._metadata_cache = loaded
-            self._metadata_cache_dirty = False
-            self._metadata_cache_save_timer = None
+            except Exception:
+                pass
+        return CachedHttpResponse(response.url, response.status_code, text)
+
+    def _remember_workshop_ui_mode(self, key: str, mode: str):
+        with self._workshop_ui_cache_lock:
+            self._workshop_ui_cache[key] = mode
+            self._workshop_ui_cache.move_to_end(key)
+            while len(self._workshop_ui_cache) > self._workshop_ui_cache_limit:
+                self._workshop_ui_cache.popitem(last=False)
+
+    def _remember_mod_metadata_locked(self, key: str, payload: dict):
+        self._metadata_cache.pop(key, None)
+        self._metadata_cache[key] = payload
+        while len(self._metadata_cache) > self._metadata_cache_memory_entries:
+            self._metadata_cache.pop(next(iter(self._metadata_cache)))
 
     def _flush_metadata_cache_save(self):
-        if not self._metadata_cache_path:
-            with self._metadata_cache_lock:
-                self._metadata_cache_save_timer = None
-                self._metadata_cache_dirty = False
-            return True
         with self._metadata_cache_lock:
             self._metadata_cache_save_timer = None
-            if not self._metadata_cache_dirty:
+            if not self._metadata_cache_path or not self._metadata_cache_dirty:
+                self._metadata_cache_dirty = False
                 return True
             self._metadata_cache_dirty = False
-            snapshot = dict(self._metadata_cache)
+            pending = self._metadata_cache_pending
+            touched = self._metadata_cache_touched
+            self._metadata_cache_pending = {}
+            self._metadata_cache_touched = {}
         try:
-            temp_path = f"{self._metadata_cache_path}.tmp"
-            with open(temp_path, "w", encoding="utf-8") as file:
-                json.dump(snapshot, file, ensure_ascii=False)
-            os.replace(temp_path, self._metadata_cache_path)
+            self._metadata_cache_store.write(pending, touched)
             return True
         except Exception as e:
+            with self._metadata_cache_lock:
+                for key, payload in pending.items():
+                    self._metadata_cache_pending.setdefault(key, payload)
             self.log(
                 f"Failed to save metadata cache: {e}",
                 tone="bad",
@@ -675,6 +2626,8 @@ class StreamlineWebBackend:
     def _schedule_metadata_cache_save(self):
         if not self._metadata_cache_path:
             with self._metadata_cache_lock:
+                self._metadata_cache_pending = {}
+                self._metadata_cache_touched = {}
                 self._metadata_cache_dirty = False
                 self._metadata_cache_save_timer = None
             return
@@ -700,12 +2653,24 @@ class StreamlineWebBackend:
             return None
         with self._metadata_cache_lock:
             payload = self._metadata_cache.get(key)
+        if payload is None and self._metadata_cache_path:
+            try:
+                payload = self._metadata_cache_store.get(key)
+            except Exception:
+                payload = None
+            if payload is not None:
+                with self._metadata_cache_lock:
+                    self._remember_mod_metadata_locked(key, payload)
         normalized = self._normalize_cached_mod_metadata(key, payload)
         if not normalized:
             return None
         ts = float(normalized.get("ts", 0.0) or 0.0)
         if ts and (time.time() - ts) > self._metadata_cache_ttl_sec:
             return None
+        if self._metadata_cache_path:
+            with self._metadata_cache_lock:
+                self._metadata_cache_touched[key] = time.time()
+            self._schedule_metadata_cache_save()
         return normalized
 
     def _cache_mod_metadata(self, mod_id: str, info: dict):
@@ -725,7 +2690,9 @@ class StreamlineWebBackend:
             "ts": time.time(),
         }
         with self._metadata_cache_lock:
-            self._metadata_cache[key] = payload
+            self._remember_mod_metadata_locked(key, payload)
+            if self._metadata_cache_path:
+                self._metadata_cache_pending[key] = payload
         self._schedule_metadata_cache_save()
 
     def _apply_mod_metadata_update(self, mod_id: str, metadata: dict):
@@ -742,141 +2709,117 @@ class StreamlineWebBackend:
             app_id = str(app_id_raw).strip() if app_id_raw else None
             game_name = str(metadata.get("game_name", "")).strip()
 
+            fields = {}
             if mod_name and not self._mod_name_needs_hydration(mod_name, key):
                 if self._mod_name_needs_hydration(queue_mod.get("mod_name"), key):
-                    queue_mod["mod_name"] = mod_name
-                    updated = True
+                    fields["mod_name"] = mod_name
             if app_id and not queue_mod.get("app_id"):
-                queue_mod["app_id"] = app_id
-                updated = True
+                fields["app_id"] = app_id
             if game_name:
                 current_game = str(queue_mod.get("game_name", "")).strip()
                 if (not current_game) or current_game == "Unknown Game" or current_game.startswith("AppID "):
-                    queue_mod["game_name"] = game_name
-                    updated = True
+                    fields["game_name"] = game_name
+            if fields:
+                self._update_queue_mod_fields_locked(queue_mod, fields)
+                updated = True
         return updated
 
-    def _hydrate_mod_metadata_worker(self, mod_id: str, collection_game_info=None):
-        key = str(mod_id or "").strip()
-        if not key:
-            return
+    def _metadata_from_published_file_details(self, mod_id: str, entry, collection_game_info=None):
+        if not isinstance(entry, dict):
+            return None
         try:
+            result_code = int(entry.get("result", 0) or 0)
+        except (TypeError, ValueError):
+            result_code = 0
+        title = str(entry.get("title", "") or "").strip()
+        if result_code != 1 or not title:
+            return None
+        app_id = str(entry.get("consumer_app_id", "") or "").strip() or None
+        if not app_id and collection_game_info:
+            app_id = collection_game_info.get("app_id")
+        game_name = self.app_ids.get(str(app_id)) if app_id else None
+        if not game_name and collection_game_info and str(collection_game_info.get("app_id") or "") == str(app_id or ""):
+            game_name = collection_game_info.get("game_name")
+        if not game_name:
+            game_name = f"AppID {app_id}" if app_id else "Unknown Game"
+        return {"mod_id": str(mod_id), "mod_name": title, "app_id": app_id, "game_name": game_name}
+
+    def _hydrate_mod_metadata_batch(self, batch):
+        resolved = {}
+        missing = []
+        collection_info_by_id = dict(batch)
+        for key, _collection_game_info in batch:
             metadata = self._get_cached_mod_metadata(key)
             if metadata is None:
-                metadata = self._get_mod_info(key, collection_game_info=collection_game_info)
+                missing.append(key)
+            else:
+                resolved[key] = metadata
+
+        if missing:
+            details_by_id = self._fetch_published_file_details_batch(missing, chunk_size=self._hydration_batch_size)
+            for key in missing:
+                if self._shutting_down:
+                    break
+                collection_game_info = collection_info_by_id.get(key)
+                metadata = self._metadata_from_published_file_details(key, details_by_id.get(key), collection_game_info)
+                if metadata is None:
+                    metadata = self._get_mod_info(key, collection_game_info=collection_game_info)
                 if isinstance(metadata, dict):
                     self._cache_mod_metadata(key, metadata)
-            if isinstance(metadata, dict) and self._apply_mod_metadata_update(key, metadata):
-                self._emit_queue_refresh_throttled()
-        except Exception:
-            pass
-        finally:
+                    resolved[key] = metadata
+
+        updated = False
+        for key, metadata in resolved.items():
+            if self._apply_mod_metadata_update(key, metadata):
+                updated = True
+        if updated:
+            self._emit_queue_refresh_throttled()
+
+    def _drain_mod_metadata_hydration(self):
+        time.sleep(self._hydration_coalesce_sec)
+        while not self._shutting_down:
             with self._hydration_lock:
-                self._hydration_inflight.discard(key)
+                if not self._hydration_pending:
+                    self._hydration_drainers -= 1
+                    return
+                batch = []
+                while self._hydration_pending and len(batch) < self._hydration_batch_size:
+                    key = next(iter(self._hydration_pending))
+                    batch.append((key, self._hydration_pending.pop(key)))
+            try:
+                self._hydrate_mod_metadata_batch(batch)
+            except Exception:
+                pass
+            finally:
+                with self._hydration_lock:
+                    for key, _collection_game_info in batch:
+                        self._hydration_inflight.discard(key)
+        with self._hydration_lock:
+            self._hydration_drainers -= 1
 
     def _schedule_mod_metadata_hydration(self, mod_ids, collection_game_info=None):
         if not mod_ids or self._shutting_down:
             return
-        for mod_id in mod_ids:
-            key = str(mod_id or "").strip()
-            if not key:
-                continue
-            with self._hydration_lock:
-                if key in self._hydration_inflight:
+        with self._hydration_lock:
+            for mod_id in mod_ids:
+                key = str(mod_id or "").strip()
+                if not key or key in self._hydration_inflight:
                     continue
                 self._hydration_inflight.add(key)
+                self._hydration_pending[key] = collection_game_info
+            wanted = -(-len(self._hydration_pending) // self._hydration_batch_size)
+            to_start = max(0, min(self._hydration_workers, wanted) - self._hydration_drainers)
+            self._hydration_drainers += to_start
+        for _ in range(to_start):
             try:
-                self._hydration_executor.submit(self._hydrate_mod_metadata_worker, key, collection_game_info)
+                self._hydration_executor.submit(self._drain_mod_metadata_hydration)
             except RuntimeError:
                 with self._hydration_lock:
-                    self._hydration_inflight.discard(key)
-
-    def _compute_queue_stats(self, queue_items):
-        stats = {
-            "total": 0,
-            "queued": 0,
-            "downloaded": 0,
-            "failed": 0,
-            "downloading": 0,
-        }
-        for mod in queue_items:
-            stats["total"] += 1
-            status = str(mod.get("status", ""))
-            if status == "Queued":
-                stats["queued"] += 1
-            if status == "Downloaded":
-                stats["downloaded"] += 1
-            if "Failed" in status:
-                stats["failed"] += 1
-            if status == "Downloading":
-                stats["downloading"] += 1
-        return stats
-
-    def _filter_queue_for_view(self, queue_items, filter_name):
-        filter_name = str(filter_name or "All")
-        if filter_name == "Queued":
-            return [mod for mod in queue_items if str(mod.get("status", "")) == "Queued"]
-        if filter_name == "Downloaded":
-            return [mod for mod in queue_items if str(mod.get("status", "")) == "Downloaded"]
-        if filter_name == "Failed":
-            return [mod for mod in queue_items if "Failed" in str(mod.get("status", ""))]
-        return list(queue_items)
-
-    def _search_queue_for_view(self, queue_items, search_query, regex_enabled, case_sensitive):
-        query = str(search_query or "").strip()
-        if not query:
-            return list(queue_items), False
-
-        regex_enabled = bool(regex_enabled)
-        case_sensitive = bool(case_sensitive)
-
-        if regex_enabled:
-            flags = 0 if case_sensitive else re.IGNORECASE
-            try:
-                pattern = re.compile(query, flags)
-            except re.error:
-                return [], True
-            return [
-                mod for mod in queue_items
-                if pattern.search(str(mod.get("mod_id", ""))) or pattern.search(str(mod.get("mod_name", "")))
-            ], False
-
-        if case_sensitive:
-            return [
-                mod for mod in queue_items
-                if query in str(mod.get("mod_id", "")) or query in str(mod.get("mod_name", ""))
-            ], False
-
-        lowered = query.lower()
-        return [
-            mod for mod in queue_items
-            if lowered in str(mod.get("mod_id", "")).lower() or lowered in str(mod.get("mod_name", "")).lower()
-        ], False
-
-    def _sort_queue_for_view(self, queue_items, sort_key, sort_direction):
-        sort_key = str(sort_key or "").strip()
-        if sort_key not in {"game_name", "mod_id", "mod_name", "status", "provider"}:
-            return list(queue_items)
-
-        reverse = str(sort_direction or "asc").strip().lower() == "desc"
-
-        if sort_key == "mod_id":
-            def mod_id_key(mod):
-                value = str(mod.get("mod_id", "")).strip()
-                if value.isdigit():
-                    return (0, int(value))
-                return (1, value.lower())
-
-            return sorted(queue_items, key=mod_id_key, reverse=reverse)
-
-        def text_key(mod):
-            return str(mod.get(sort_key, "")).lower()
-
-        return sorted(queue_items, key=text_key, reverse=reverse)
+                    self._hydration_drainers -= 1
 
     def get_bootstrap_data(self):
         with self.state_lock:
-            queue_stats = self._compute_queue_stats(self.download_queue)
+            queue_stats = dict(self._queue_index.stats)
         return {
             "version": self.app_version,
             "config": dict(self.config),
@@ -893,7 +2836,7 @@ class StreamlineWebBackend:
 
     def get_preview_queue(self):
         with self.state_lock:
-            return [dict(mod) for mod in self.download_queue]
+            return [mod.to_dict() for mod in self.download_queue]
 
     def get_queue(self):
         return self.get_preview_queue()
@@ -930,56 +2873,57 @@ class StreamlineWebBackend:
         if normalized["sort_direction"] not in {"asc", "desc"}:
             normalized["sort_direction"] = "asc"
 
+        descending = normalized["sort_direction"] == "desc"
         with self.state_lock:
-            cache = self._queue_query_cache
-            revision = int(self._queue_revision)
-            cache_valid = (
-                isinstance(cache, dict)
-                and cache.get("revision") == revision
-                and cache.get("filter_name") == normalized["filter_name"]
-                and cache.get("search_query") == normalized["search_query"]
-                and cache.get("regex_enabled") == normalized["regex_enabled"]
-                and cache.get("case_sensitive") == normalized["case_sensitive"]
-                and cache.get("sort_key") == normalized["sort_key"]
-                and cache.get("sort_direction") == normalized["sort_direction"]
-            )
-
-            if not cache_valid:
-                base_queue = list(self.download_queue)
-                queue_stats = self._compute_queue_stats(base_queue)
-                filtered = self._filter_queue_for_view(base_queue, normalized["filter_name"])
-                searched, regex_error = self._search_queue_for_view(
-                    filtered,
+            self._queue_last_view = (normalized["filter_name"], normalized["sort_key"], bool(normalized["search_query"]))
+            queue_stats = dict(self._queue_index.stats)
+            regex_error = False
+            if not normalized["search_query"]:
+                total = self._queue_index.count(normalized["filter_name"], normalized["sort_key"])
+                offset = min(offset, total)
+                page_ids = self._queue_index.page(
+                    normalized["filter_name"],
+                    normalized["sort_key"],
+                    descending,
+                    offset,
+                    limit,
+                )
+            else:
+                view_key = (
+                    normalized["filter_name"],
                     normalized["search_query"],
                     normalized["regex_enabled"],
                     normalized["case_sensitive"],
-                )
-                sorted_items = self._sort_queue_for_view(
-                    searched,
                     normalized["sort_key"],
                     normalized["sort_direction"],
                 )
-                cache = {
-                    "revision": revision,
-                    "filter_name": normalized["filter_name"],
-                    "search_query": normalized["search_query"],
-                    "regex_enabled": normalized["regex_enabled"],
-                    "case_sensitive": normalized["case_sensitive"],
-                    "sort_key": normalized["sort_key"],
-                    "sort_direction": normalized["sort_direction"],
-                    "regex_error": bool(regex_error),
-                    "stats": queue_stats,
-                    "items": sorted_items,
-                }
-                self._queue_query_cache = cache
-
-            total = len(cache.get("items", []))
-            if offset > total:
-                offset = total
-            end = min(total, offset + limit)
-            page_items = [dict(mod) for mod in cache.get("items", [])[offset:end]]
-            queue_stats = dict(cache.get("stats", {}))
-            regex_error = bool(cache.get("regex_error", False))
+                structure_version = self._queue_index.structure_version
+                view = self._queue_views.get(view_key, structure_version)
+                if view is None:
+                    searched_ids, search_regex_error = self._queue_index.search_ids(
+                        normalized["search_query"],
+                        normalized["regex_enabled"],
+                        normalized["case_sensitive"],
+                        normalized["filter_name"],
+                        normalized["sort_key"],
+                        descending,
+                    )
+                    view = {
+                        "structure_version": structure_version,
+                        "dependencies": queue_view_dependencies(
+                            normalized["filter_name"],
+                            normalized["sort_key"],
+                            searched=True,
+                        ),
+                        "regex_error": bool(search_regex_error),
+                        "mod_ids": searched_ids,
+                    }
+                    self._queue_views.put(view_key, view)
+                total = len(view["mod_ids"])
+                offset = min(offset, total)
+                page_ids = view["mod_ids"][offset:offset + limit]
+                regex_error = view["regex_error"]
+            page_items = [self._queue_mod_map[mod_id].to_dict() for mod_id in page_ids if mod_id in self._queue_mod_map]
 
         return {
             "success": True,
@@ -994,33 +2938,20 @@ class StreamlineWebBackend:
     def remove_mods(self, mod_ids):
         target_ids = {str(mod_id) for mod_id in (mod_ids or [])}
         with self.state_lock:
-            before = len(self.download_queue)
-            self.download_queue = [mod for mod in self.download_queue if str(mod.get("mod_id")) not in target_ids]
-            self._rebuild_queue_indexes_locked()
-            removed = before - len(self.download_queue)
+            removed_ids = self._remove_queue_mods_locked(sorted(target_ids))
+            removed = len(removed_ids)
+            if removed:
+                self._journal_queue_locked({"op": "remove", "mod_ids": removed_ids})
         self._emit_event("queue", {"action": "refresh"})
         return {"success": True, "removed": removed}
 
     def move_mods(self, mod_ids, direction: str):
-        ids = {str(mod_id) for mod_id in (mod_ids or [])}
+        ids = sorted({str(mod_id) for mod_id in (mod_ids or [])})
         with self.state_lock:
-            if direction == "top":
-                selected = [mod for mod in self.download_queue if str(mod.get("mod_id")) in ids]
-                unselected = [mod for mod in self.download_queue if str(mod.get("mod_id")) not in ids]
-                self.download_queue = selected + unselected
-            elif direction == "bottom":
-                selected = [mod for mod in self.download_queue if str(mod.get("mod_id")) in ids]
-                unselected = [mod for mod in self.download_queue if str(mod.get("mod_id")) not in ids]
-                self.download_queue = unselected + selected
-            elif direction == "up":
-                for i in range(1, len(self.download_queue)):
-                    if str(self.download_queue[i].get("mod_id")) in ids and str(self.download_queue[i - 1].get("mod_id")) not in ids:
-                        self.download_queue[i - 1], self.download_queue[i] = self.download_queue[i], self.download_queue[i - 1]
-            elif direction == "down":
-                for i in range(len(self.download_queue) - 2, -1, -1):
-                    if str(self.download_queue[i].get("mod_id")) in ids and str(self.download_queue[i + 1].get("mod_id")) not in ids:
-                        self.download_queue[i + 1], self.download_queue[i] = self.download_queue[i], self.download_queue[i + 1]
-            self._rebuild_queue_indexes_locked()
+            if self._queue_index.move(ids, direction):
+                self._download_queue = None
+            if ids and direction in {"top", "bottom", "up", "down"}:
+                self._journal_queue_locked({"op": "move", "mod_ids": ids, "direction": direction})
         self._emit_event("queue", {"action": "refresh"})
         return {"success": True}
 
@@ -1046,26 +2977,21 @@ class StreamlineWebBackend:
             if self.is_downloading:
                 return {"success": False, "error": "The queue cannot be reordered during a download."}
 
-            current_ids = {str(mod.get("mod_id", "")).strip() for mod in self.download_queue}
-            source_ids = [mod_id for mod_id in ordered_ids if mod_id in current_ids]
-            if not source_ids or target_id not in current_ids:
+            source_ids = [mod_id for mod_id in ordered_ids if mod_id in self._queue_mod_map]
+            if not source_ids or target_id not in self._queue_mod_map:
                 return {"success": False, "error": "Queue items changed before the reorder completed."}
 
-            source_set = set(source_ids)
-            moving = [mod for mod in self.download_queue if str(mod.get("mod_id", "")).strip() in source_set]
-            remaining = [mod for mod in self.download_queue if str(mod.get("mod_id", "")).strip() not in source_set]
-            target_index = next(
-                (index for index, mod in enumerate(remaining) if str(mod.get("mod_id", "")).strip() == target_id),
-                -1,
-            )
-            if target_index < 0:
-                return {"success": False, "error": "Queue reorder target is no longer available."}
-            insert_index = target_index + (1 if placement == "after" else 0)
-            self.download_queue = remaining[:insert_index] + moving + remaining[insert_index:]
-            self._rebuild_queue_indexes_locked()
+            moved = self._queue_index.relocate(source_ids, target_id, placement)
+            self._download_queue = None
+            self._journal_queue_locked({
+                "op": "reorder",
+                "mod_ids": source_ids,
+                "target": target_id,
+                "placement": placement,
+            })
 
         self._emit_event("queue", {"action": "refresh"})
-        return {"success": True, "moved": len(moving)}
+        return {"success": True, "moved": moved}
 
     def _extract_id(self, input_str: str):
         input_str = (input_str or "").strip()
@@ -1092,10 +3018,10 @@ class StreamlineWebBackend:
             return input_str
         return None
 
-    def _detect_input_type(self, input_text: str):
+    def _classify_input(self, input_text: str):
         input_text = (input_text or "").strip()
         if not input_text:
-            return (None, None)
+            return (None, None, None)
 
         app_id = None
         numeric_id = None
@@ -1115,26 +3041,53 @@ class StreamlineWebBackend:
             if not app_id:
                 numeric_id = self._extract_id(input_text)
 
+        def probe_item():
+            try:
+                return self._fetch_filedetails_tree(numeric_id)
+            except Exception:
+                return None
+
         if explicit_workshop_item_url and numeric_id:
-            if self._is_collection(numeric_id):
-                return ("collection", numeric_id)
-            return ("workshop_item", numeric_id)
+            tree = probe_item()
+            return (self._classify_filedetails_tree(tree), numeric_id, tree)
 
         if app_id and self._check_if_appid_has_workshop(app_id):
-            return ("game", app_id)
+            return ("game", app_id, None)
 
-        if numeric_id and numeric_id != app_id and self._check_if_appid_has_workshop(numeric_id):
-            return ("game", numeric_id)
+        if numeric_id and numeric_id != app_id:
+            executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="input-probe")
+            try:
+                app_probe = executor.submit(self._check_if_appid_has_workshop, numeric_id)
+                item_probe = executor.submit(probe_item)
+                if app_probe.result():
+                    return ("game", numeric_id, None)
+                tree = item_probe.result()
+            finally:
+                executor.shutdown(wait=False)
+            return (self._classify_filedetails_tree(tree), numeric_id, tree)
 
         if numeric_id:
-            if self._is_collection(numeric_id):
-                return ("collection", numeric_id)
-            return ("workshop_item", numeric_id)
+            tree = probe_item()
+            return (self._classify_filedetails_tree(tree), numeric_id, tree)
 
         if app_id:
-            return ("no_workshop", app_id)
+            return ("no_workshop", app_id, None)
+
+        return (None, None, None)
+
+    def _fetch_filedetails_tree(self, item_id: str, resource: str = "item"):
+        url = f"https://steamcommunity.com/sharedfiles/filedetails/?id={item_id}"
+        response = self._cached_get(url, resource, timeout=(8, 30))
+        response.raise_for_status()
+        return html.fromstring(response.text)
 
-        return (None, None)
+    def _classify_filedetails_tree(self, tree):
+        if tree is None:
+            return "workshop_item"
+        collection_items = tree.xpath('//div[contains(@class, "collectionChildren")]//div[contains(@class, "collectionItem")]')
+        if collection_items or tree.xpath('//div[contains(@class, "collectionItem")]'):
+            return "collection"
+        return "workshop_item"
 
     def _check_if_appid_has_workshop(self, app_id: str):
         return self._get_workshop_ui_mode(app_id) in {"legacy", "beta"}
@@ -1148,28 +3101,23 @@ class StreamlineWebBackend:
             return None if cached == "none" else cached
         try:
             workshop_url = f"https://steamcommunity.com/app/{key}/workshop/"
-            response = requests.get(
-                workshop_url,
-                allow_redirects=True,
-                timeout=20,
-                headers={"User-Agent": "Mozilla/5.0"},
-            )
+            response = self._cached_get(workshop_url, "workshop_mode", timeout=20)
             final_url = response.url
             if "store.steampowered.com" in final_url and "/workshop/" not in final_url:
-                self._workshop_ui_cache[key] = "none"
+                self._remember_workshop_ui_mode(key, "none")
                 return None
             if response.status_code != 200:
-                self._workshop_ui_cache[key] = "none"
+                self._remember_workshop_ui_mode(key, "none")
                 return None
             markers = ["workshopItemsContainer", "workshopBrowseItems", "workshop_browse_menu"]
             if any(marker in response.text for marker in markers):
-                self._workshop_ui_cache[key] = "legacy"
+                self._remember_workshop_ui_mode(key, "legacy")
                 return "legacy"
             tree = html.fromstring(response.text)
             if self._is_beta_workshop_app_page(tree, response.text, key):
-                self._workshop_ui_cache[key] = "beta"
+                self._remember_workshop_ui_mode(key, "beta")
                 return "beta"
-            self._workshop_ui_cache[key] = "none"
+            self._remember_workshop_ui_mode(key, "none")
             return None
         except Exception:
             return None
@@ -1201,20 +3149,6 @@ class StreamlineWebBackend:
         )
         return bool(app_links) and (bool(workshop_headers) or bool(workshop_item_links))
 
-    def _is_collection(self, item_id: str):
-        try:
-            url = f"https://steamcommunity.com/sharedfiles/filedetails/?id={item_id}"
-            response = requests.get(url, timeout=30, headers={"User-Agent": "Mozilla/5.0"})
-            response.raise_for_status()
-            tree = html.fromstring(response.text)
-            collection_items = tree.xpath('//div[contains(@class, "collectionChildren")]//div[contains(@class, "collectionItem")]')
-            if collection_items:
-                return True
-            collection_items_fallback = tree.xpath('//div[contains(@class, "collectionItem")]')
-            return len(collection_items_fallback) > 0
-        except Exception:
-            return False
-
     def _extract_mod_title_from_tree(self, tree):
         invalid_titles = (
             "steam community :: error",
@@ -1275,34 +3209,7 @@ class StreamlineWebBackend:
 
             if tree is None:
                 url = f"https://steamcommunity.com/sharedfiles/filedetails/?id={mod_id}"
-                response = None
-                last_error = None
-                for attempt in range(3):
-                    try:
-                        response = requests.get(url, timeout=(8, 20), headers={"User-Agent": "Mozilla/5.0"})
-                        if response.status_code == 200:
-                            break
-                        if response.status_code in (429, 500, 502, 503, 504):
-                            if attempt < 2:
-                                time.sleep(0.35 * (attempt + 1))
-                                response = None
-                                continue
-                        break
-                    except (requests.Timeout, requests.ConnectionError) as exc:
-                        last_error = exc
-                        response = None
-                        if attempt < 2:
-                            time.sleep(0.35 * (attempt + 1))
-                            continue
-                        break
-                    except requests.RequestException as exc:
-                        last_error = exc
-                        response = None
-                        break
-                if response is None:
-                    if last_error:
-                        raise last_error
-                    raise RuntimeError("Failed to fetch workshop item page")
+                response = self._cached_get(url, "item", timeout=(8, 20))
                 tree = html.fromstring(response.text)
 
             error_messages = tree.xpath('//div[@class="error_ctn"]//h3/text()')
@@ -1353,20 +3260,11 @@ class StreamlineWebBackend:
         try:
             if tree is None:
                 url = f"https://steamcommunity.com/sharedfiles/filedetails/?id={collection_id}"
-                response = requests.get(url, timeout=30, headers={"User-Agent": "Mozilla/5.0"})
+                response = self._cached_get(url, "collection", timeout=30)
                 response.raise_for_status()
                 tree = html.fromstring(response.text)
 
-            collection_game_info = None
-            breadcrumb_tag = tree.xpath('//div[@class="breadcrumbs"]/a[contains(@href, "/app/")]')
-            if breadcrumb_tag:
-                href = breadcrumb_tag[0].get("href", "")
-                app_id_match = re.search(r"/app/(\d+)", href)
-                if app_id_match:
-                    collection_game_info = {
-                        "app_id": app_id_match.group(1),
-                        "game_name": breadcrumb_tag[0].text_content().strip() or "Unknown Game",
-                    }
+            collection_game_info = self._extract_collection_game_info(tree)
 
             mod_ids = set()
             collection_items = tree.xpath('//div[contains(@class,"collectionChildren")]//div[contains(@class,"collectionItem")]')
@@ -1422,32 +3320,185 @@ class StreamlineWebBackend:
             )
         return mods_info
 
-    def _resolve_workshop_item(self, item_id: str, hinted_type: str = None, operation_id: str = ""):
-        url = f"https://steamcommunity.com/sharedfiles/filedetails/?id={item_id}"
-        tree = None
+    def _extract_collection_game_info(self, tree):
+        if tree is None:
+            return None
+        breadcrumb_tag = tree.xpath('//div[@class="breadcrumbs"]/a[contains(@href, "/app/")]')
+        if breadcrumb_tag:
+            href = breadcrumb_tag[0].get("href", "")
+            app_id_match = re.search(r"/app/(\d+)", href)
+            if app_id_match:
+                return {
+                    "app_id": app_id_match.group(1),
+                    "game_name": breadcrumb_tag[0].text_content().strip() or "Unknown Game",
+                }
+        return None
+
+    def _fetch_collection_details_batch(self, collection_ids, timeout=20, chunk_size=100):
+        normalized_ids = []
+        seen = set()
+        for collection_id in (collection_ids or []):
+            key = str(collection_id or "").strip()
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            normalized_ids.append(key)
+        if not normalized_ids:
+            return {}
+
+        url = "https://api.steampowered.com/ISteamRemoteStorage/GetCollectionDetails/v1/"
+        children_by_id = {}
+        safe_chunk_size = max(1, int(chunk_size or 1))
+
+        for start in range(0, len(normalized_ids), safe_chunk_size):
+            chunk = normalized_ids[start:start + safe_chunk_size]
+            payload = {"collectioncount": len(chunk)}
+            for index, collection_id in enumerate(chunk):
+                payload[f"publishedfileids[{index}]"] = collection_id
+
+            try:
+                response = self.http.post(url, data=payload, timeout=timeout)
+                details = response.json().get("response", {}).get("collectiondetails", [])
+            except Exception:
+                continue
+
+            if not isinstance(details, list):
+                continue
+
+            for index, entry in enumerate(details):
+                if not isinstance(entry, dict) or int(entry.get("result", 0) or 0) != 1:
+                    continue
+                entry_id = str(entry.get("publishedfileid", "")).strip()
+                if not entry_id and index < len(chunk):
+                    entry_id = chunk[index]
+                if not entry_id:
+                    continue
+                children = [child for child in (entry.get("children") or []) if isinstance(child, dict)]
+                children.sort(key=lambda child: int(child.get("sortorder", 0) or 0))
+                children_by_id[entry_id] = [
+                    (str(child.get("publishedfileid", "")).strip(), int(child.get("filetype", 0) or 0) == 2)
+                    for child in children
+                    if str(child.get("publishedfileid", "")).strip()
+                ]
+
+        return children_by_id
+
+    def _collection_child_mod(self, mod_id: str, details, collection_game_info=None):
+        details = details if isinstance(details, dict) else {}
+        mod_name = ""
+        app_id = None
+        if int(details.get("result", 0) or 0) == 1:
+            mod_name = str(details.get("title", "") or "").strip()
+            app_id = str(details.get("consumer_app_id") or details.get("creator_app_id") or "").strip() or None
+        if not app_id and collection_game_info:
+            app_id = collection_game_info.get("app_id")
+        if app_id and collection_game_info and str(collection_game_info.get("app_id")) == app_id:
+            game_name = collection_game_info.get("game_name", "Unknown Game")
+        else:
+            game_name = self.app_ids.get(str(app_id), "Unknown Game") if app_id else "Unknown Game"
+        if not mod_name:
+            # Hidden, removed or unreturned items keep the "Mod <id>" placeholder that queue hydration fills in.
+            return {"mod_id": str(mod_id), "mod_name": f"Mod {mod_id}", "app_id": app_id, "game_name": game_name}
+        result = {"mod_id": str(mod_id), "mod_name": mod_name, "app_id": app_id, "game_name": game_name}
+        if app_id:
+            self._cache_mod_metadata(str(mod_id), result)
+        return result
+
+    def _expand_collection(self, collection_id: str, on_batch, tree=None, operation_id: str = ""):
+        collection_id = str(collection_id)
+        collection_game_info = self._extract_collection_game_info(tree)
+        visited = {collection_id}
+        frontier = deque([collection_id])
+        seen_items = set()
+        found = 0
+        expanded = 0
+        cycles = 0
+        unresolved = 0
+        chunk_size = max(1, int(self._collection_details_chunk_size))
+
+        executor = ThreadPoolExecutor(
+            max_workers=self._collection_expand_workers,
+            thread_name_prefix="collection-expand",
+        )
+        pending = {}
+        try:
+            while frontier or pending:
+                while frontier and len(pending) < self._collection_expand_workers:
+                    batch_ids = [frontier.popleft() for _ in range(min(chunk_size, len(frontier)))]
+                    pending[executor.submit(self._fetch_collection_details_batch, batch_ids, 20, chunk_size)] = ("collections", batch_ids)
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, key = pending.pop(future)
+                    if kind == "items":
+                        details_by_id = future.result()
+                        mods = [
+                            self._collection_child_mod(mod_id, details_by_id.get(mod_id), collection_game_info)
+                            for mod_id in key
+                        ]
+                        unresolved += sum(1 for mod_id in key if int((details_by_id.get(mod_id) or {}).get("result", 0) or 0) != 1)
+                        found += len(mods)
+                        on_batch(mods)
+                        continue
+
+                    children_by_id = future.result()
+                    item_ids = []
+                    for parent_id in key:
+                        children = children_by_id.get(parent_id)
+                        if children is None:
+                            if parent_id == collection_id:
+                                return None
+                            self.log(
+                                f"Skipped nested collection {parent_id}: details unavailable.",
+                                tone="warn",
+                                source="queue",
+                                action="collection_child_skipped",
+                                context={"collection_id": collection_id, "child_collection_id": parent_id, "operation_state": "warn"},
+                                operation_id=operation_id,
+                            )
+                            continue
+                        expanded += 1
+                        for child_id, is_collection in children:
+                            if is_collection:
+                                if child_id in visited:
+                                    cycles += 1
+                                    continue
+                                visited.add(child_id)
+                                frontier.append(child_id)
+                            elif child_id not in seen_items:
+                                seen_items.add(child_id)
+                                item_ids.append(child_id)
+                    for start in range(0, len(item_ids), chunk_size):
+                        chunk = item_ids[start:start + chunk_size]
+                        pending[executor.submit(self._fetch_published_file_details_batch, chunk, 20, chunk_size)] = ("items", chunk)
+        finally:
+            # An early return or a failing on_batch must not wait for lookups nobody will read.
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        self.log(
+            f"Collection {collection_id} expanded: {found:,} items across {expanded:,} collection(s).",
+            source="queue",
+            action="collection_expanded",
+            context={
+                "collection_id": collection_id,
+                "items_found": found,
+                "collections": expanded,
+                "cycles_skipped": cycles,
+                "items_unresolved": unresolved,
+                "operation_state": "run",
+            },
+            operation_id=operation_id,
+        )
+        return found
+
+    def _resolve_workshop_item(self, item_id: str, hinted_type: str = None, operation_id: str = "", tree=None, on_batch=None):
         last_error = None
-        for attempt in range(3):
-            response = None
+        if tree is None:
             try:
-                response = requests.get(url, timeout=(8, 30), headers={"User-Agent": "Mozilla/5.0"})
-                response.raise_for_status()
-                tree = html.fromstring(response.text)
-                break
+                tree = self._fetch_filedetails_tree(item_id, "collection" if hinted_type == "collection" else "item")
             except Exception as error:
                 last_error = error
-                status_code = int(getattr(response, "status_code", 0) or 0)
-                retryable = status_code in {429, 500, 502, 503, 504} or isinstance(
-                    error,
-                    (requests.Timeout, requests.ConnectionError),
-                )
-                if not retryable or attempt >= 2:
-                    break
-                retry_after = 0.0
-                try:
-                    retry_after = float(response.headers.get("Retry-After", 0) or 0) if response is not None else 0.0
-                except (TypeError, ValueError):
-                    retry_after = 0.0
-                time.sleep(min(5.0, max(retry_after, 0.5 * (attempt + 1))))
 
         if tree is None:
             if hinted_type == "collection":
@@ -1473,9 +3524,11 @@ class StreamlineWebBackend:
             return "workshop_item", [fallback]
 
         collection_items = tree.xpath('//div[contains(@class,"collectionChildren")]//div[contains(@class,"collectionItem")]')
-        if collection_items:
-            return "collection", self._scrape_collection_mods(item_id, tree=tree, operation_id=operation_id)
-        if hinted_type == "collection":
+        if collection_items or hinted_type == "collection":
+            mods = []
+            expanded = self._expand_collection(item_id, on_batch=on_batch or mods.extend, tree=tree, operation_id=operation_id)
+            if expanded is not None:
+                return "collection", mods
             return "collection", self._scrape_collection_mods(item_id, tree=tree, operation_id=operation_id)
         return "workshop_item", [self._get_mod_info(item_id, tree=tree)]
 
@@ -1616,7 +3669,7 @@ class StreamlineWebBackend:
         seen_mod_ids = set()
         game_name = self.app_ids.get(str(app_id), f"AppID {app_id}")
 
-        response = requests.get(base_url, params=params, timeout=30, headers={"User-Agent": "Mozilla/5.0"})
+        response = self.http.get(base_url, params=params, timeout=30)
         response.raise_for_status()
         tree = html.fromstring(response.text)
 
@@ -1664,46 +3717,15 @@ class StreamlineWebBackend:
         def fetch_page(page_number: int):
             page_params = dict(params)
             page_params["p"] = str(page_number)
-            retries = 3
-            for attempt in range(retries):
-                try:
-                    page_response = requests.get(
-                        base_url,
-                        params=page_params,
-                        timeout=30,
-                        headers={"User-Agent": "Mozilla/5.0"},
-                    )
-                    if page_response.status_code == 200:
-                        return page_response.text
-                except Exception:
-                    pass
-                if attempt < (retries - 1):
-                    time.sleep(0.25 * (attempt + 1))
-            return None
+            try:
+                page_response = self.http.get(base_url, params=page_params, timeout=30)
+            except Exception:
+                return None
+            if page_response.status_code != 200:
+                return None
+            return self._parse_workshop_page(page_response.text, app_id=str(app_id), game_name=game_name)
 
-        pages_fetched = 1
-        pages_failed = 0
-        for start in range(2, total_pages + 1, concurrency):
-            end = min(start + concurrency - 1, total_pages)
-            with ThreadPoolExecutor(max_workers=min(concurrency, end - start + 1)) as executor:
-                futures = {executor.submit(fetch_page, page): page for page in range(start, end + 1)}
-                batch_results = {}
-                for future in as_completed(futures):
-                    page_number = futures[future]
-                    try:
-                        page_content = future.result()
-                    except Exception:
-                        pages_failed += 1
-                        continue
-                    if not page_content:
-                        pages_failed += 1
-                        continue
-                    batch_results[page_number] = self._parse_workshop_page(page_content, app_id=str(app_id), game_name=game_name)
-                    pages_fetched += 1
-                ordered_batch_mods = []
-                for page_number in sorted(batch_results):
-                    ordered_batch_mods.extend(batch_results[page_number])
-                emit_batch(ordered_batch_mods, pages_fetched, total_pages)
+        def log_progress():
             self.log(
                 f"Pages fetched: {pages_fetched} / {total_pages}",
                 tone="warn" if pages_failed > 0 else "info",
@@ -1719,6 +3741,43 @@ class StreamlineWebBackend:
                 operation_id=operation_id,
             )
 
+        pages_fetched = 1
+        pages_failed = 0
+        pages_completed = 1
+        next_page_to_submit = 2
+        next_page_to_emit = 2
+        window_size = max(1, concurrency) * 2
+        pending_pages = {}
+        in_flight = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, total_pages - 1))) as executor:
+            while in_flight or next_page_to_submit <= total_pages:
+                while next_page_to_submit <= total_pages and next_page_to_submit - next_page_to_emit < window_size:
+                    in_flight[executor.submit(fetch_page, next_page_to_submit)] = next_page_to_submit
+                    next_page_to_submit += 1
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_number = in_flight.pop(future)
+                    try:
+                        page_mods = future.result()
+                    except Exception:
+                        page_mods = None
+                    if page_mods is None:
+                        pages_failed += 1
+                        page_mods = []
+                    else:
+                        pages_fetched += 1
+                    pages_completed += 1
+                    pending_pages[page_number] = page_mods
+                    if pages_completed % max(1, concurrency) == 0:
+                        log_progress()
+                ordered_batch_mods = []
+                while next_page_to_emit in pending_pages:
+                    ordered_batch_mods.extend(pending_pages.pop(next_page_to_emit))
+                    next_page_to_emit += 1
+                emit_batch(ordered_batch_mods, pages_fetched, total_pages)
+        if pages_completed % max(1, concurrency) != 0:
+            log_progress()
+
         return mods
 
     def _provider_for_mod(self, mod: dict, selected_provider: str):
@@ -1738,7 +3797,7 @@ class StreamlineWebBackend:
                 if str(mod.get("mod_id")) in ids:
                     new_provider = self._provider_for_mod(mod, provider)
                     if mod.get("provider") != new_provider:
-                        mod["provider"] = new_provider
+                        self._update_queue_mod_fields_locked(mod, {"provider": new_provider})
                         changed += 1
         self._emit_event("queue", {"action": "refresh"})
         return {"success": True, "changed": changed}
@@ -1754,7 +3813,7 @@ class StreamlineWebBackend:
                 for mod in self.download_queue:
                     new_provider = self._provider_for_mod(mod, provider)
                     if mod.get("provider") != new_provider:
-                        mod["provider"] = new_provider
+                        self._update_queue_mod_fields_locked(mod, {"provider": new_provider})
                         changed += 1
             self._emit_event("queue", {"action": "refresh"})
 
@@ -1772,9 +3831,11 @@ class StreamlineWebBackend:
         with self.state_lock:
             for mod in self.download_queue:
                 if str(mod.get("mod_id")) in ids:
-                    mod["app_id"] = str(app_id)
-                    mod["game_name"] = game_name
-                    mod["provider"] = self._provider_for_mod(mod, self.config.get("download_provider", "Default"))
+                    self._update_queue_mod_fields_locked(mod, {"app_id": str(app_id), "game_name": game_name})
+                    self._update_queue_mod_fields_locked(
+                        mod,
+                        {"provider": self._provider_for_mod(mod, self.config.get("download_provider", "Default"))},
+                    )
                     changed += 1
 
         self._emit_event("queue", {"action": "refresh"})
@@ -1786,8 +3847,7 @@ class StreamlineWebBackend:
         with self.state_lock:
             for mod in self.download_queue:
                 if str(mod.get("mod_id")) in ids:
-                    mod["status"] = "Queued"
-                    mod["retry_count"] = 0
+                    self._update_queue_mod_fields_locked(mod, {"status": "Queued", "retry_count": 0})
                     reset_count += 1
         self._emit_event("queue", {"action": "refresh"})
         return {"success": True, "reset": reset_count}
@@ -1806,7 +3866,7 @@ class StreamlineWebBackend:
                 if not mod_id or self._is_mod_in_queue(mod_id):
                     skipped += 1
                     continue
-                queue_mod = {
+                queue_mod = QueueEntry({
                     "game_name": game_name,
                     "mod_id": mod_id,
                     "mod_name": mod_name,
@@ -1814,12 +3874,18 @@ class StreamlineWebBackend:
                     "retry_count": 0,
                     "app_id": app_id or None,
                     "provider": provider or "Default"
-                }
+                })
                 self.download_queue.append(queue_mod)
                 self._queue_mod_ids.add(mod_id)
                 self._queue_mod_map[mod_id] = queue_mod
+                self._queue_index.add(queue_mod)
                 added += 1
                 added_mod_ids.append(mod_id)
+            if added_mod_ids:
+                self._journal_queue_locked({
+                    "op": "append",
+                    "mods": [self._persisted_queue_mod(self._queue_mod_map[mod_id]) for mod_id in added_mod_ids],
+                })
         self._emit_event("queue", {"action": "refresh"})
         return {
             "success": True,
@@ -1854,18 +3920,20 @@ class StreamlineWebBackend:
         if not file_path:
             return {"success": False, "error": "Invalid export path."}
         with self.state_lock:
-            queue_copy = [dict(mod) for mod in self.download_queue]
-
-        with open(file_path, "w", encoding="utf-8", newline="") as file:
-            writer = csv.writer(file, delimiter="|", lineterminator="\n")
-            for mod in queue_copy:
-                writer.writerow([
+            rows = [
+                (
                     mod.get("game_name", "Unknown Game"),
                     mod.get("mod_id", ""),
                     mod.get("mod_name", "Unknown Title"),
                     mod.get("provider", "Default"),
                     mod.get("app_id") or "",
-                ])
+                )
+                for mod in self.download_queue
+            ]
+
+        with open(file_path, "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file, delimiter="|", lineterminator="\n")
+            writer.writerows(rows)
 
         return {"success": True, "path": file_path}
 
@@ -1880,7 +3948,7 @@ class StreamlineWebBackend:
         mod_id = str(mod.get("mod_id", "")).strip()
         if not mod_id or self._is_mod_in_queue(mod_id):
             return False
-        queue_mod = {
+        queue_mod = QueueEntry({
             "game_name": mod.get("game_name", "Unknown Game"),
             "mod_id": mod_id,
             "mod_name": mod.get("mod_name", "Unknown Title"),
@@ -1888,10 +3956,13 @@ class StreamlineWebBackend:
             "retry_count": 0,
             "app_id": mod.get("app_id"),
             "provider": self._provider_for_mod(mod, selected_provider)
-        }
-        self.download_queue.append(queue_mod)
-        self._queue_mod_ids.add(mod_id)
-        self._queue_mod_map[mod_id] = queue_mod
+        })
+        with self.state_lock:
+            self.download_queue.append(queue_mod)
+            self._queue_mod_ids.add(mod_id)
+            self._queue_mod_map[mod_id] = queue_mod
+            self._queue_index.add(queue_mod)
+            self._journal_queue_locked({"op": "append", "mods": [self._persisted_queue_mod(queue_mod)]})
         return True
 
     def _append_mods_to_queue_bulk(self, mods, selected_provider: str):
@@ -1926,7 +3997,7 @@ class StreamlineWebBackend:
                 if not merged_mod_name:
                     merged_mod_name = f"Mod {mod_id}"
 
-                queue_mod = {
+                queue_mod = QueueEntry({
                     "game_name": merged_game_name,
                     "mod_id": mod_id,
                     "mod_name": merged_mod_name,
@@ -1942,10 +4013,11 @@ class StreamlineWebBackend:
                         },
                         selected_provider,
                     ),
-                }
+                })
                 self.download_queue.append(queue_mod)
                 self._queue_mod_ids.add(mod_id)
                 self._queue_mod_map[mod_id] = queue_mod
+                self._queue_index.add(queue_mod)
                 added += 1
                 added_mod_ids.append(mod_id)
 
@@ -1963,6 +4035,11 @@ class StreamlineWebBackend:
                     hydration_candidates.append(mod_id)
 
             queue_size = len(self.download_queue)
+            if added_mod_ids:
+                self._journal_queue_locked({
+                    "op": "append",
+                    "mods": [self._persisted_queue_mod(self._queue_mod_map[mod_id]) for mod_id in added_mod_ids],
+                })
 
         if hydration_candidates:
             self._schedule_mod_metadata_hydration(
@@ -2075,7 +4152,7 @@ class StreamlineWebBackend:
             operation_id=operation_id,
         )
 
-        input_type, item_id = self._detect_input_type(item_url)
+        input_type, item_id, item_tree = self._classify_input(item_url)
         if not input_type or not item_id:
             self.log(
                 "Queue input failed: invalid input.",
@@ -2110,6 +4187,19 @@ class StreamlineWebBackend:
             )
             return {"success": False, "error": "Queue Entire Workshop is disabled in Settings."}
 
+        added = 0
+        skipped = 0
+        queue_size = 0
+
+        def stream_batch(batch_mods):
+            nonlocal added, skipped, queue_size
+            result = self._append_mods_to_queue_bulk(batch_mods, provider)
+            added += int(result.get("added", 0))
+            skipped += int(result.get("skipped", 0))
+            queue_size = int(result.get("queue_size", queue_size))
+            if result.get("added", 0) or result.get("skipped", 0):
+                self._emit_queue_refresh_throttled()
+
         try:
             if input_type == "game":
                 with self.state_lock:
@@ -2162,6 +4252,8 @@ class StreamlineWebBackend:
                     str(item_id),
                     hinted_type=input_type,
                     operation_id=operation_id,
+                    tree=item_tree,
+                    on_batch=stream_batch,
                 )
                 if resolved_type == "collection" and input_type != "collection":
                     self.log(
@@ -2171,7 +4263,7 @@ class StreamlineWebBackend:
                         context={"item_id": str(item_id), "operation_state": "run"},
                         operation_id=operation_id,
                     )
-                if not mods:
+                if not mods and not (added or skipped):
                     if resolved_type == "collection":
                         self.log(
                             f"Collection queue failed: no items found for {item_id}.",
@@ -2203,18 +4295,9 @@ class StreamlineWebBackend:
             )
             return {"success": False, "error": f"Failed to queue workshop item(s): {e}"}
 
-        added = 0
-        skipped = 0
-        queue_size = 0
         chunk_size = 400
         for start in range(0, len(mods), chunk_size):
-            chunk = mods[start:start + chunk_size]
-            result = self._append_mods_to_queue_bulk(chunk, provider)
-            added += int(result.get("added", 0))
-            skipped += int(result.get("skipped", 0))
-            queue_size = int(result.get("queue_size", queue_size))
-            if result.get("added", 0) or result.get("skipped", 0):
-                self._emit_queue_refresh_throttled()
+            stream_batch(mods[start:start + chunk_size])
 
         self._emit_queue_refresh_throttled(force=True)
         if input_type == "game":
@@ -2295,7 +4378,8 @@ class StreamlineWebBackend:
             cached_name = str(cached.get("mod_name", "")).strip()
             if cached_name and not self._mod_name_needs_hydration(cached_name, mod_id):
                 try:
-                    mod["mod_name"] = cached_name
+                    with self.state_lock:
+                        self._update_queue_mod_fields_locked(mod, {"mod_name": cached_name})
                 except Exception:
                     pass
                 return cached_name
@@ -2323,13 +4407,15 @@ class StreamlineWebBackend:
             fetched_name = str(fetched.get("mod_name", "")).strip()
             if fetched_name and not self._mod_name_needs_hydration(fetched_name, mod_id):
                 try:
-                    mod["mod_name"] = fetched_name
+                    fields = {"mod_name": fetched_name}
                     fetched_app_id = fetched.get("app_id")
                     fetched_game_name = fetched.get("game_name")
                     if fetched_app_id and not mod.get("app_id"):
-                        mod["app_id"] = str(fetched_app_id)
+                        fields["app_id"] = str(fetched_app_id)
                     if fetched_game_name and (not mod.get("game_name") or str(mod.get("game_name")) == "Unknown Game"):
-                        mod["game_name"] = str(fetched_game_name)
+                        fields["game_name"] = str(fetched_game_name)
+                    with self.state_lock:
+                        self._update_queue_mod_fields_locked(mod, fields)
                 except Exception:
                     pass
                 return fetched_name
@@ -2472,10 +4558,92 @@ class StreamlineWebBackend:
         if not os.path.isdir(source_path):
             return self._check_mod_folder_exists(mod)
 
+        self._relocate_steamcmd_output(source_path, target_path, str(mod.get("mod_id", "")))
+        return True
+
+    def _relocate_steamcmd_output(self, source_path, target_path, mod_id=""):
         os.makedirs(os.path.dirname(target_path), exist_ok=True)
         if os.path.isdir(target_path):
             shutil.rmtree(target_path, ignore_errors=True)
-        shutil.move(source_path, target_path)
+        try:
+            os.replace(source_path, target_path)
+            return
+        except OSError:
+            pass
+        self._copy_tree_with_progress(source_path, target_path, mod_id)
+        shutil.rmtree(source_path, ignore_errors=True)
+
+    def _copy_tree_with_progress(self, source_path, target_path, mod_id=""):
+        total_bytes = 0
+        for dir_path, _, file_names in os.walk(source_path):
+            for file_name in file_names:
+                total_bytes += self._get_file_size(os.path.join(dir_path, file_name))
+        partial_path = f"{target_path}.partial"
+        shutil.rmtree(partial_path, ignore_errors=True)
+        copied_bytes = 0
+        last_log_at = time.monotonic()
+        for dir_path, _, file_names in os.walk(source_path):
+            target_dir = os.path.normpath(os.path.join(partial_path, os.path.relpath(dir_path, source_path)))
+            os.makedirs(target_dir, exist_ok=True)
+            for file_name in file_names:
+                source_file = os.path.join(dir_path, file_name)
+                target_file = os.path.join(target_dir, file_name)
+                with open(source_file, "rb") as src, open(target_file, "wb") as dst:
+                    while True:
+                        chunk = src.read(1 << 20)
+                        if not chunk:
+                            break
+                        dst.write(chunk)
+                        copied_bytes += len(chunk)
+                        now = time.monotonic()
+                        if now - last_log_at >= self._move_progress_log_interval_sec:
+                            last_log_at = now
+                            percent = int(copied_bytes * 100 / total_bytes) if total_bytes else 100
+                            self.log(
+                                f"Copying mod {mod_id} to Downloads/SteamCMD: {percent}%",
+                                source="download",
+                                action="move_copy_progress",
+                                context={
+                                    "mod_id": str(mod_id),
+                                    "copied_bytes": copied_bytes,
+                                    "total_bytes": total_bytes,
+                                    "operation_state": "run",
+                                },
+                            )
+                shutil.copystat(source_file, target_file)
+        os.replace(partial_path, target_path)
+
+    def _move_completed_steamcmd_item(self, mod, cancel_is_immediate=False):
+        if cancel_is_immediate and self.canceled:
+            return False
+        source_path = self._get_steamcmd_content_path(mod)
+        if not os.path.isdir(source_path):
+            return False
+        mod_id = str(mod.get("mod_id", ""))
+        move_mod = {
+            "mod_id": mod_id,
+            "mod_name": mod.get("mod_name") or f"Mod {mod_id}",
+            "app_id": str(mod.get("app_id", "")),
+            "provider": "SteamCMD",
+        }
+        target_path = self._get_steamcmd_target_path(move_mod, allow_remote_lookup=True)
+        try:
+            self._relocate_steamcmd_output(source_path, target_path, mod_id)
+            if not os.path.isdir(target_path):
+                raise RuntimeError(f"Moved output was not found at {target_path}")
+        except Exception as e:
+            self.log(
+                f"Failed to move mod {mod_id} to Downloads/SteamCMD: {e}",
+                tone="warn",
+                source="download",
+                action="move_downloaded_mod_failed",
+                context={"mod_id": mod_id, "error": str(e), "operation_state": "warn"},
+            )
+            return False
+        self._update_mod_download_log(move_mod)
+        self._mark_session_downloaded(move_mod)
+        self._set_mod_status(mod, "Downloaded")
+        self._maybe_log_download_progress(str(self._active_download_operation_id or ""), force=False)
         return True
 
     def _get_mod_log_path(self):
@@ -2570,6 +4738,11 @@ class StreamlineWebBackend:
             output_path = str(mod.get("_webapi_file_path", "") or "").strip()
             if output_path:
                 log_entry["file_name"] = os.path.basename(output_path)
+                log_entry["file_size"] = self._get_file_size(output_path)
+            content_hash = str(mod.get("_webapi_content_hash", "") or "")
+            if content_hash:
+                log_entry["content_hash"] = content_hash
+                log_entry["hcontent_file"] = str(mod.get("_webapi_hcontent_file", "") or "")
         logs = self._get_mod_download_logs_cache()
         with self._mod_logs_lock:
             logs[mod_id] = log_entry
@@ -2584,6 +4757,31 @@ class StreamlineWebBackend:
         filename = re.sub(r'[<>:"/\\|?*]', "_", filename.strip()).strip(" .")
         return filename or f"{mod_id}.zip"
 
+    def _get_webapi_part_path(self, file_path, file_details=None):
+        details = file_details if isinstance(file_details, dict) else {}
+        version = re.sub(r"[^0-9A-Za-z]", "", str(details.get("hcontent_file") or details.get("time_updated") or ""))
+        part_path = f"{file_path}.{version}.part" if version else f"{file_path}.part"
+        directory, base_name = os.path.split(file_path)
+        try:
+            for name in os.listdir(directory or "."):
+                stale_path = os.path.join(directory, name)
+                if (
+                    name.startswith(f"{base_name}.")
+                    and name.endswith((".part", ".part.segments"))
+                    and stale_path not in (part_path, f"{part_path}.segments")
+                ):
+                    os.remove(stale_path)
+        except OSError:
+            pass
+        return part_path
+
+    def _get_webapi_buffer_size(self):
+        try:
+            buffer_kb = int(self.config.get("webapi_download_buffer_kb", 1024) or 1024)
+        except (TypeError, ValueError):
+            buffer_kb = 1024
+        return max(64, min(16384, buffer_kb)) * 1024
+
     def _get_logged_webapi_file_path(self, mod_id, download_logs):
         log_entry = (download_logs or {}).get(str(mod_id), {})
         if not isinstance(log_entry, dict) or log_entry.get("provider") != "SteamWebAPI":
@@ -2619,7 +4817,7 @@ class StreamlineWebBackend:
                 payload[f"publishedfileids[{index}]"] = mod_id
 
             try:
-                response = requests.post(url, data=payload, timeout=timeout)
+                response = self.http.post(url, data=payload, timeout=timeout)
                 details = response.json().get("response", {}).get("publishedfiledetails", [])
             except Exception:
                 continue
@@ -2707,7 +4905,7 @@ class StreamlineWebBackend:
         self.session_steamcmd_downloads.add(mod_id)
 
     def _set_mod_status(self, mod, status, retry_count=None, failure_detail=None):
-        if not isinstance(mod, dict):
+        if not isinstance(mod, (dict, QueueEntry)):
             return False
         mod_id = str(mod.get("mod_id", "")).strip()
         changed = False
@@ -2720,25 +4918,21 @@ class StreamlineWebBackend:
         if is_failure and not normalized_failure_detail:
             normalized_failure_detail = f"Download status: {normalized_status}"
         with self.state_lock:
+            fields = {}
             if mod.get("status") != status:
                 previous_status = str(mod.get("status", ""))
-                mod["status"] = status
+                fields["status"] = status
                 changed = True
                 status_changed = True
 
-                # Rebuild cached queue views only when filter/sort depends on status.
-                cache = self._queue_query_cache if isinstance(self._queue_query_cache, dict) else None
-                if cache is not None:
-                    cached_filter = str(cache.get("filter_name", "All") or "All")
-                    cached_sort_key = str(cache.get("sort_key", "") or "")
-                    if cached_filter != "All" or cached_sort_key == "status":
-                        self._queue_revision += 1
-                        invalidate_queue_view = True
+                # The UI only needs to refetch when the view it last asked for depends on status.
+                if self._queue_last_view is not None and "status" in queue_view_dependencies(*self._queue_last_view):
+                    invalidate_queue_view = True
             if retry_count is not None:
                 retry_value = max(0, int(retry_count))
                 current_retry = int(mod.get("retry_count", 0) or 0)
                 if current_retry != retry_value:
-                    mod["retry_count"] = retry_value
+                    fields["retry_count"] = retry_value
                     changed = True
                     if mod_id and mod_id in self._active_download_targets:
                         prev_retry = int(self._active_download_retry_by_mod.get(mod_id, 0) or 0)
@@ -2747,22 +4941,19 @@ class StreamlineWebBackend:
             current_failure_detail = str(mod.get("failure_detail", "") or "")
             next_failure_detail = normalized_failure_detail if is_failure else ""
             if current_failure_detail != next_failure_detail:
-                if next_failure_detail:
-                    mod["failure_detail"] = next_failure_detail
-                else:
-                    mod.pop("failure_detail", None)
+                fields["failure_detail"] = next_failure_detail
                 changed = True
+            if fields:
+                self._update_queue_mod_fields_locked(mod, fields)
         if status_changed and mod_id:
             retry_value = int(mod.get("retry_count", 0) or 0)
-            self._emit_event(
-                "queue_status",
+            self._queue_status_for_batch(
+                mod_id,
                 {
-                    "mod_id": mod_id,
                     "status": status,
                     "previous_status": previous_status if status_changed else str(status),
                     "invalidate_queue_view": invalidate_queue_view,
                     "retry_count": retry_value,
-                    "max_retries": int(self._download_max_retries),
                     "failure_detail": normalized_failure_detail if is_failure else "",
                 },
             )
@@ -2773,6 +4964,44 @@ class StreamlineWebBackend:
                 self._maybe_log_download_progress(active_op_id, force=False)
         return changed
 
+    def _queue_status_for_batch(self, mod_id: str, update: dict):
+        with self._status_batch_lock:
+            pending = self._status_batch_pending.get(mod_id)
+            if pending is not None:
+                update = dict(
+                    update,
+                    previous_status=pending["previous_status"],
+                    invalidate_queue_view=pending["invalidate_queue_view"] or update["invalidate_queue_view"],
+                )
+            self._status_batch_pending[mod_id] = update
+            if self._status_batch_timer is not None and self._status_batch_timer.is_alive():
+                return
+            self._status_batch_timer = threading.Timer(self._status_batch_interval_sec, self._flush_queue_status_batch)
+            self._status_batch_timer.daemon = True
+            self._status_batch_timer.start()
+
+    def _flush_queue_status_batch(self):
+        with self._status_batch_lock:
+            self._status_batch_timer = None
+            pending = self._status_batch_pending
+            self._status_batch_pending = {}
+            if not pending:
+                return
+            updates = list(pending.values())
+            # Emit under the lock so a queue or download event cannot overtake a batch already taken.
+            self._emit_event(
+                "queue_status_batch",
+                {
+                    "mod_ids": list(pending.keys()),
+                    "statuses": [update["status"] for update in updates],
+                    "previous_statuses": [update["previous_status"] for update in updates],
+                    "retry_counts": [update["retry_count"] for update in updates],
+                    "failure_details": [update["failure_detail"] for update in updates],
+                    "max_retries": int(self._download_max_retries),
+                    "invalidate_queue_view": any(update["invalidate_queue_view"] for update in updates),
+                },
+            )
+
     def _format_duration_short(self, seconds: float):
         value = max(0.0, float(seconds or 0.0))
         if value < 60.0:
@@ -2885,9 +5114,20 @@ class StreamlineWebBackend:
             operation_id=op_id,
         )
 
-    def _cleanup_appworkshop_acf_files(self):
-        for workshop_dir in self._get_steamcmd_workshop_dir_paths():
-            if not os.path.isdir(workshop_dir):
+    def _get_steamcmd_worker_workshop_dirs(self, worker):
+        roots = [worker.install_dir] if worker.install_dir else self._get_steamcmd_runtime_root_candidates()
+        return [os.path.join(root, "steamapps", "workshop") for root in roots]
+
+    def _cleanup_appworkshop_acf_files(self, workshop_dirs=None):
+        with self.state_lock:
+            live_workers = [worker for worker in self._steamcmd_live_workers if worker.is_running()]
+        live_dirs = set()
+        for worker in live_workers:
+            live_dirs.update(self._get_steamcmd_worker_workshop_dirs(worker))
+        if workshop_dirs is None:
+            workshop_dirs = self._get_steamcmd_workshop_dir_paths()
+        for workshop_dir in workshop_dirs:
+            if workshop_dir in live_dirs or not os.path.isdir(workshop_dir):
                 continue
             for file_name in os.listdir(workshop_dir):
                 if file_name.lower().startswith("appworkshop_") and file_name.lower().endswith(".acf"):
@@ -2987,10 +5227,7 @@ class StreamlineWebBackend:
 
                     target_path = self._get_steamcmd_target_path(move_mod, allow_remote_lookup=True)
                     try:
-                        os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                        if os.path.isdir(target_path):
-                            shutil.rmtree(target_path, ignore_errors=True)
-                        shutil.move(source_path, target_path)
+                        self._relocate_steamcmd_output(source_path, target_path, str(mod_id))
                         if not os.path.isdir(target_path):
                             raise RuntimeError(f"Moved output was not found at {target_path}")
                         moved_mod_ids.add(str(mod_id))
@@ -3056,35 +5293,319 @@ class StreamlineWebBackend:
             return ["anonymous"]
         return [username]
 
-    def _download_mod_webapi(self, mod, file_details=None):
-        mod_id = str(mod["mod_id"])
+    def _get_webapi_store_path(self, content_hash):
+        content_hash = str(content_hash or "").lower()
+        if not re.fullmatch(r"[0-9a-f]{64}", content_hash):
+            return ""
+        return os.path.join(self._webapi_store_dir, content_hash[:2], content_hash)
+
+    def _prune_webapi_store(self):
+        if not os.path.isdir(self._webapi_store_dir):
+            return
+        for dir_path, _, file_names in os.walk(self._webapi_store_dir):
+            for file_name in file_names:
+                path = os.path.join(dir_path, file_name)
+                if file_name.endswith(".stat"):
+                    if not os.path.isfile(path[: -len(".stat")]):
+                        try:
+                            os.remove(path)
+                        except OSError:
+                            pass
+                    continue
+                try:
+                    if os.stat(path).st_nlink <= 1:
+                        os.remove(path)
+                        if os.path.isfile(f"{path}.stat"):
+                            os.remove(f"{path}.stat")
+                except OSError:
+                    pass
+
+    def _get_webapi_store_stamp(self, store_path):
+        stat = os.stat(store_path)
+        return [int(stat.st_size), int(stat.st_mtime_ns)]
+
+    def _save_webapi_store_stamp(self, store_path):
+        stamp_path = f"{store_path}.stat"
         try:
-            if not isinstance(file_details, dict):
-                file_details = self._fetch_published_file_details_batch([mod_id], timeout=30, chunk_size=1).get(mod_id, {})
-            file_url = file_details.get("file_url")
-            if not file_url:
-                return False, "The Steam Web API did not provide a download URL for this workshop item."
+            temp_path = f"{stamp_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self._get_webapi_store_stamp(store_path), f)
+            os.replace(temp_path, stamp_path)
+        except OSError:
+            pass
 
-            filename = self._get_webapi_filename(mod, file_details)
-            file_path = os.path.join(self._get_download_path(mod), filename)
+    def _verify_webapi_store_file(self, store_path, content_hash, expected_size):
+        if not store_path or not os.path.isfile(store_path):
+            return False
+        size = self._get_file_size(store_path)
+        if size <= 0 or (expected_size and size != expected_size):
+            return False
+        # The store shares its inode with the linked Downloads file, so an in-place edit there changes it too.
+        # Only rehash when its size or mtime moved away from what was recorded when it was stored.
+        stamp_path = f"{store_path}.stat"
+        try:
+            with open(stamp_path, "r", encoding="utf-8") as f:
+                if json.load(f) == self._get_webapi_store_stamp(store_path):
+                    return True
+        except Exception:
+            pass
+        block_digests = {}
+        try:
+            BlockDigestCursor(block_digests, size, store_path, seed_from=0).finish()
+        except OSError:
+            return False
+        if combine_block_digests(block_digests, size) == str(content_hash or "").lower():
+            self._save_webapi_store_stamp(store_path)
+            return True
+        for path in (store_path, stamp_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return False
+
+    def _link_webapi_store_file(self, store_path, file_path):
+        temp_path = f"{file_path}.link"
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        os.link(store_path, temp_path)
+        os.replace(temp_path, file_path)
+
+    def _commit_webapi_download(self, part_path, file_path, content_hash):
+        store_path = self._get_webapi_store_path(content_hash)
+        try:
+            os.makedirs(os.path.dirname(store_path), exist_ok=True)
+            if self._verify_webapi_store_file(store_path, content_hash, self._get_file_size(part_path)):
+                self._link_webapi_store_file(store_path, file_path)
+                os.remove(part_path)
+                return
+            os.replace(part_path, file_path)
+            temp_path = f"{store_path}.tmp"
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            os.link(file_path, temp_path)
+            os.replace(temp_path, store_path)
+            self._save_webapi_store_stamp(store_path)
+        except OSError:
+            if os.path.isfile(part_path):
+                os.replace(part_path, file_path)
 
-            download_response = requests.get(file_url, stream=True, timeout=120)
-            if download_response.status_code != 200:
+    def _download_webapi_stream(self, file_url, part_path, block_digests, offset=0):
+        headers = {"Range": f"bytes={offset}-"} if offset >= self._webapi_resume_min_bytes else {}
+        download_response = self.http.get(file_url, stream=True, timeout=120, headers=headers)
+        try:
+            if download_response.status_code == 206 and headers:
+                content_range = str(download_response.headers.get("Content-Range", ""))
+                if not content_range.startswith(f"bytes {offset}-"):
+                    return False, f"The download server returned an unexpected range ({content_range or 'none'})."
+                mode = "ab"
+            elif download_response.status_code == 200:
+                mode = "wb"
+            else:
                 return False, f"The download server returned HTTP {download_response.status_code}."
 
-            with open(file_path, "wb") as file:
-                for chunk in download_response.iter_content(chunk_size=8192):
+            cursor = BlockDigestCursor(block_digests, offset if mode == "ab" else 0, part_path, seed_from=0)
+            chunk_size = self._get_webapi_buffer_size()
+            with open(part_path, mode, buffering=chunk_size) as file:
+                for chunk in download_response.iter_content(chunk_size=chunk_size):
                     if chunk:
                         file.write(chunk)
-            if not os.path.isfile(file_path) or os.path.getsize(file_path) <= 0:
+                        cursor.update(chunk)
+            cursor.finish()
+        finally:
+            download_response.close()
+        return True, ""
+
+    def _load_webapi_segment_state(self, state_path, part_path, expected_size, block_digests):
+        if not os.path.isfile(state_path) or self._get_file_size(part_path) != expected_size:
+            return None
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if int(state.get("size", 0)) != expected_size:
+                return None
+            block_digests.update({int(index): str(digest) for index, digest in (state.get("blocks") or {}).items()})
+            return [[int(start), int(end)] for start, end in state.get("ranges", []) if int(start) < int(end)]
+        except Exception:
+            block_digests.clear()
+            return None
+
+    def _save_webapi_segment_state(self, state_path, expected_size, segments, block_digests):
+        temp_path = f"{state_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "size": expected_size,
+                    "ranges": [segment for segment in segments if segment[0] < segment[1]],
+                    "blocks": {str(index): digest for index, digest in dict(block_digests).items()},
+                },
+                f,
+            )
+        os.replace(temp_path, state_path)
+
+    def _download_webapi_segments(self, file_url, part_path, expected_size, block_digests):
+        state_path = f"{part_path}.segments"
+        segments = self._load_webapi_segment_state(state_path, part_path, expected_size, block_digests)
+        if segments is None:
+            count = max(2, min(self._webapi_max_segments, expected_size // self._webapi_segment_target_bytes))
+            step = -(-expected_size // count)
+            step = -(-step // WEBAPI_HASH_BLOCK_SIZE) * WEBAPI_HASH_BLOCK_SIZE
+            segments = [[start, min(expected_size, start + step)] for start in range(0, expected_size, step)]
+            with open(part_path, "wb") as file:
+                file.truncate(expected_size)
+            self._save_webapi_segment_state(state_path, expected_size, segments, block_digests)
+
+        pending = deque(segments)
+        lock = threading.Lock()
+        errors = []
+        chunk_size = self._get_webapi_buffer_size()
+        progress = {"saved_at": time.monotonic()}
+
+        def fetch_segments():
+            with open(part_path, "r+b", buffering=0) as file:
+                while True:
+                    with lock:
+                        if errors or not pending:
+                            return
+                        segment = pending.popleft()
+                    start, end = segment
+                    response = self.http.get(
+                        file_url,
+                        stream=True,
+                        timeout=120,
+                        headers={"Range": f"bytes={start}-{end - 1}"},
+                    )
+                    try:
+                        content_range = str(response.headers.get("Content-Range", ""))
+                        if response.status_code != 206 or not content_range.startswith(f"bytes {start}-"):
+                            with lock:
+                                errors.append(response.status_code)
+                            return
+                        cursor = BlockDigestCursor(block_digests, start, part_path)
+                        file.seek(start)
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            if not chunk:
+                                continue
+                            chunk = chunk[:segment[1] - segment[0]]
+                            file.write(chunk)
+                            cursor.update(chunk)
+                            with lock:
+                                segment[0] += len(chunk)
+                                now = time.monotonic()
+                                if now - progress["saved_at"] >= 1.0:
+                                    progress["saved_at"] = now
+                                    self._save_webapi_segment_state(state_path, expected_size, segments, block_digests)
+                            if segment[0] >= segment[1]:
+                                break
+                        if segment[0] >= expected_size:
+                            cursor.finish()
+                    finally:
+                        response.close()
+                    if segment[0] < segment[1]:
+                        with lock:
+                            errors.append(f"The download stopped at byte {segment[0]:,} of a segment ending at {segment[1]:,}.")
+                        return
+
+        def run_fetcher():
+            try:
+                fetch_segments()
+            except Exception as e:
+                with lock:
+                    errors.append(f"Segment download error: {e}")
+
+        extra_connections = 0
+        while extra_connections < len(segments) - 1 and self._webapi_connection_budget.acquire(blocking=False):
+            extra_connections += 1
+        try:
+            if extra_connections:
+                with ThreadPoolExecutor(max_workers=extra_connections + 1, thread_name_prefix="webapi-segment") as executor:
+                    for future in [executor.submit(run_fetcher) for _ in range(extra_connections + 1)]:
+                        future.result()
+            else:
+                run_fetcher()
+        finally:
+            for _ in range(extra_connections):
+                self._webapi_connection_budget.release()
+
+        if errors and errors[0] == 200:
+            for path in (part_path, state_path):
                 try:
-                    if os.path.isfile(file_path):
-                        os.remove(file_path)
+                    os.remove(path)
                 except OSError:
                     pass
-                return False, "The downloaded file was missing or empty."
+            return None, ""
+        if errors or any(segment[0] < segment[1] for segment in segments):
+            self._save_webapi_segment_state(state_path, expected_size, segments, block_digests)
+            error = errors[0] if errors else "The download ended before every segment finished."
+            if isinstance(error, int):
+                error = f"The download server returned HTTP {error}."
+            return False, error
+        os.remove(state_path)
+        return True, ""
+
+    def _download_mod_webapi(self, mod, file_details=None, stored_content_hash=""):
+        mod_id = str(mod["mod_id"])
+        try:
+            if not isinstance(file_details, dict):
+                file_details = self._fetch_published_file_details_batch([mod_id], timeout=30, chunk_size=1).get(mod_id, {})
+            file_url = file_details.get("file_url")
+            if not file_url:
+                return False, "The Steam Web API did not provide a download URL for this workshop item."
+
+            filename = self._get_webapi_filename(mod, file_details)
+            file_path = os.path.join(self._get_download_path(mod), filename)
+            try:
+                expected_size = int(file_details.get("file_size", 0) or 0)
+            except (TypeError, ValueError):
+                expected_size = 0
+
+            content_hash = ""
+            store_path = self._get_webapi_store_path(stored_content_hash) if stored_content_hash else ""
+            if self._verify_webapi_store_file(store_path, stored_content_hash, expected_size):
+                self._link_webapi_store_file(store_path, file_path)
+                content_hash = stored_content_hash
+            else:
+                part_path = self._get_webapi_part_path(file_path, file_details)
+                block_digests = {}
+                segment_state_path = f"{part_path}.segments"
+                offset = 0
+                if os.path.isfile(part_path) and not os.path.isfile(segment_state_path):
+                    offset = self._get_file_size(part_path)
+                if expected_size and offset > expected_size:
+                    os.remove(part_path)
+                    offset = 0
+                if expected_size and offset == expected_size:
+                    BlockDigestCursor(block_digests, offset, part_path, seed_from=0).finish()
+                else:
+                    fetched = False
+                    if expected_size >= self._webapi_segment_min_bytes or os.path.isfile(segment_state_path):
+                        fetched, failure_detail = self._download_webapi_segments(file_url, part_path, expected_size, block_digests)
+                        if fetched is None:
+                            offset = 0
+                            block_digests.clear()
+                        elif not fetched:
+                            return False, failure_detail
+                    if not fetched:
+                        fetched, failure_detail = self._download_webapi_stream(file_url, part_path, block_digests, offset)
+                        if not fetched:
+                            return False, failure_detail
+
+                part_size = self._get_file_size(part_path) if os.path.isfile(part_path) else 0
+                if part_size <= 0:
+                    return False, "The downloaded file was missing or empty."
+                if expected_size and part_size != expected_size:
+                    if part_size > expected_size:
+                        os.remove(part_path)
+                    return False, f"The download stopped at {part_size:,} of {expected_size:,} bytes."
+                content_hash = combine_block_digests(block_digests, part_size)
+                if not content_hash:
+                    os.remove(part_path)
+                    return False, "The downloaded file could not be verified."
+                self._commit_webapi_download(part_path, file_path, content_hash)
             with self.state_lock:
                 mod["_webapi_file_path"] = file_path
+                mod["_webapi_content_hash"] = content_hash
+                mod["_webapi_hcontent_file"] = str(file_details.get("hcontent_file", "") or "")
                 self.session_webapi_files[mod_id] = file_path
             self._update_mod_download_log(mod)
             self._mark_session_downloaded(mod)
@@ -3119,6 +5640,11 @@ class StreamlineWebBackend:
             download_logs = dict(download_logs_cache)
         existing_mod_behavior = self.config.get("steamcmd_existing_mod_behavior", "Only Redownload if Updated")
         max_workers = max(1, min(6, len(webapi_mods)))
+        stored_hash_by_hcontent = {}
+        if existing_mod_behavior != "Always Redownload":
+            for entry in download_logs.values():
+                if isinstance(entry, dict) and entry.get("hcontent_file") and entry.get("content_hash"):
+                    stored_hash_by_hcontent[str(entry["hcontent_file"])] = str(entry["content_hash"])
 
         def download_one(mod):
             if cancel_is_immediate and self.canceled:
@@ -3127,6 +5653,13 @@ class StreamlineWebBackend:
             file_details = details_by_mod_id.get(mod_id, {})
             existing_path, log_entry = self._get_logged_webapi_file_path(mod_id, download_logs)
             should_download = True
+            if existing_path and existing_mod_behavior != "Skip Existing Mods":
+                try:
+                    logged_size = int(log_entry.get("file_size", 0) or 0)
+                except (TypeError, ValueError):
+                    logged_size = 0
+                if logged_size and self._get_file_size(existing_path) != logged_size:
+                    existing_path = None
             if existing_path:
                 if existing_mod_behavior == "Skip Existing Mods":
                     should_download = False
@@ -3141,6 +5674,9 @@ class StreamlineWebBackend:
                         remote_timestamp = 0
                     if local_timestamp and remote_timestamp and remote_timestamp <= local_timestamp:
                         should_download = False
+                    remote_content = str(file_details.get("hcontent_file", "") or "")
+                    if remote_content and remote_content == str(log_entry.get("hcontent_file", "") or ""):
+                        should_download = False
 
                 if should_download:
                     try:
@@ -3156,7 +5692,9 @@ class StreamlineWebBackend:
                 return
 
             self._set_mod_status(mod, "Downloading")
-            success, failure_detail = self._download_mod_webapi(mod, file_details)
+            stored_content_hash = stored_hash_by_hcontent.get(str(file_details.get("hcontent_file", "") or ""), "")
+            with self._webapi_connection_budget:
+                success, failure_detail = self._download_mod_webapi(mod, file_details, stored_content_hash)
             if success:
                 self._set_mod_status(mod, "Downloaded")
                 return
@@ -3265,52 +5803,244 @@ class StreamlineWebBackend:
         if not download_candidates:
             return
 
-        cmd = [self.steamcmd_exe, "+login", *self._get_steamcmd_login_parts()]
+        shards = self._plan_steamcmd_shards(download_candidates, self._get_steamcmd_instance_count())
+        if len(shards) == 1:
+            self._download_steamcmd_shard(0, shards[0], cancel_is_immediate)
+        else:
+            with ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="steamcmd-shard") as executor:
+                futures = [
+                    executor.submit(self._download_steamcmd_shard, slot, shard_mods, cancel_is_immediate)
+                    for slot, shard_mods in enumerate(shards)
+                ]
+                for future in as_completed(futures):
+                    future.result()
+
+        if not (cancel_is_immediate and self.canceled):
+            self._cleanup_appworkshop_acf_files()
+        self._maybe_log_download_progress(str(self._active_download_operation_id or ""), force=True)
+
+    def _get_steamcmd_instance_count(self):
+        try:
+            instances = int(self.config.get("steamcmd_instances", 1) or 1)
+        except Exception:
+            instances = 1
+        if self._get_steamcmd_login_parts() != ["anonymous"]:
+            return 1
+        return max(1, min(self._steamcmd_max_instances, instances))
+
+    def _plan_steamcmd_shards(self, mods, instances):
+        app_mods = {}
+        for mod in mods:
+            app_mods.setdefault(str(mod.get("app_id", "")).strip(), []).append(mod)
+        shards = sorted(app_mods.values(), key=len, reverse=True)
+        while len(shards) < instances and len(shards[0]) > 1:
+            largest = shards.pop(0)
+            half = len(largest) // 2
+            shards.extend((largest[:half], largest[half:]))
+            shards.sort(key=len, reverse=True)
+        if len(shards) > instances:
+            bins = [[] for _ in range(instances)]
+            for shard_mods in shards:
+                min(bins, key=len).extend(shard_mods)
+            shards = bins
+        return [shard_mods for shard_mods in shards if shard_mods]
+
+    def _get_steamcmd_shard_dir(self, slot):
+        return os.path.join(self.steamcmd_dir, "shards", str(int(slot)))
+
+    def _acquire_steamcmd_worker(self, slot, item_ids=()):
+        login_parts = self._get_steamcmd_login_parts()
+        with self.state_lock:
+            worker = self._steamcmd_workers.pop(slot, None)
+        if worker is not None:
+            idle_expired = time.time() - worker.last_used > self._steamcmd_worker_idle_sec
+            # A warm worker remembers the items it already fetched and reports them as up to date.
+            refetch = not worker.item_ids.isdisjoint(item_ids)
+            if idle_expired or refetch or not worker.is_running() or worker.login_parts != login_parts:
+                self._retire_steamcmd_worker(worker)
+                worker = None
+        if worker is None:
+            install_dir = ""
+            if slot > 0:
+                install_dir = self._get_steamcmd_shard_dir(slot)
+                os.makedirs(install_dir, exist_ok=True)
+            worker = SteamCmdWorker(self.steamcmd_exe, self.steamcmd_dir, login_parts, install_dir)
+            process = worker.start()
+            with self.state_lock:
+                self.steamcmd_processes.add(process)
+                self._steamcmd_live_workers.add(worker)
+        return worker
+
+    def _release_steamcmd_worker(self, slot, worker, healthy):
+        worker.last_used = time.time()
+        if healthy and worker.is_running() and worker.items_done < self._steamcmd_worker_recycle_items:
+            with self.state_lock:
+                if not self._shutting_down and slot not in self._steamcmd_workers:
+                    self._steamcmd_workers[slot] = worker
+                    self._schedule_steamcmd_idle_check()
+                    return
+        self._retire_steamcmd_worker(worker, force=not healthy)
+
+    def _retire_steamcmd_worker(self, worker, force=False):
+        process = worker.process
+        worker.close(force=force)
+        with self.state_lock:
+            self.steamcmd_processes.discard(process)
+            self._steamcmd_live_workers.discard(worker)
+        self._cleanup_appworkshop_acf_files(self._get_steamcmd_worker_workshop_dirs(worker))
+
+    def _schedule_steamcmd_idle_check(self, delay=None):
+        with self.state_lock:
+            if self._shutting_down or not self._steamcmd_workers:
+                return
+            if self._steamcmd_idle_timer is not None and self._steamcmd_idle_timer.is_alive():
+                return
+            if delay is None:
+                delay = self._steamcmd_worker_idle_sec
+            self._steamcmd_idle_timer = threading.Timer(max(1.0, float(delay)), self._retire_idle_steamcmd_workers)
+            self._steamcmd_idle_timer.daemon = True
+            self._steamcmd_idle_timer.start()
+
+    def _retire_idle_steamcmd_workers(self):
+        now = time.time()
+        idle_workers = []
+        with self.state_lock:
+            self._steamcmd_idle_timer = None
+            for slot, worker in list(self._steamcmd_workers.items()):
+                if now - worker.last_used >= self._steamcmd_worker_idle_sec:
+                    idle_workers.append(self._steamcmd_workers.pop(slot))
+            next_check = min(
+                (worker.last_used + self._steamcmd_worker_idle_sec - now for worker in self._steamcmd_workers.values()),
+                default=None,
+            )
+        for worker in idle_workers:
+            self._retire_steamcmd_worker(worker)
+        if idle_workers:
+            self.log(
+                f"Closed {len(idle_workers)} idle SteamCMD session(s).",
+                source="download",
+                action="steamcmd_idle_retire",
+                context={"workers": len(idle_workers), "idle_sec": self._steamcmd_worker_idle_sec},
+            )
+        if next_check is not None:
+            self._schedule_steamcmd_idle_check(next_check)
+
+    def _close_steamcmd_workers(self, force=False):
+        with self.state_lock:
+            workers = list(self._steamcmd_workers.values())
+            self._steamcmd_workers = {}
+            idle_timer = self._steamcmd_idle_timer
+            self._steamcmd_idle_timer = None
+        if idle_timer is not None:
+            try:
+                idle_timer.cancel()
+            except Exception:
+                pass
+        for worker in workers:
+            self._retire_steamcmd_worker(worker, force=force)
+
+    def _download_steamcmd_shard(self, slot, download_candidates, cancel_is_immediate=False):
         mod_lookup = {}
         status_map = {}
         failure_details = {}
+        move_futures = {}
+        items = []
         for mod in download_candidates:
             app_id = str(mod.get("app_id"))
             mod_id = str(mod.get("mod_id"))
             mod_lookup[mod_id] = mod
             status_map[mod_id] = "Downloading"
             self._set_mod_status(mod, "Downloading")
-            cmd.extend(["+workshop_download_item", app_id, mod_id])
-        cmd.append("+quit")
-
-        self.current_process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            stdin=subprocess.PIPE,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            cwd=self.steamcmd_dir,
-            shell=False,
-            creationflags=subprocess.CREATE_NO_WINDOW if platform.system().lower() == "windows" else 0,
-        )
+            items.append((app_id, mod_id))
 
         success_re = re.compile(r"Success\. Downloaded item (\d+)", re.IGNORECASE)
         failure_re = re.compile(r"ERROR! Download item (\d+) failed \(([^)]+)\)", re.IGNORECASE)
-
-        if self.current_process.stdout:
-            for line in self.current_process.stdout:
+        timeout_re = re.compile(r"ERROR! Timeout downloading item (\d+)", re.IGNORECASE)
+        session_error_re = re.compile(r"Logging in user .*(?:FAILED|ERROR)|ERROR! Not logged on|FAILED login", re.IGNORECASE)
+
+        worker = self._acquire_steamcmd_worker(slot, mod_lookup)
+        worker.discard_output()
+        healthy = worker.submit(items)
+        if not healthy:
+            self._retire_steamcmd_worker(worker, force=True)
+            worker = self._acquire_steamcmd_worker(slot, mod_lookup)
+            healthy = worker.submit(items)
+        pending_ids = set(mod_lookup)
+        if cancel_is_immediate and self.canceled:
+            worker.close(force=True)
+        item_timeout = float(self._steamcmd_item_timeout_sec)
+        deadline = time.monotonic() + item_timeout
+        try:
+            while pending_ids:
+                if cancel_is_immediate and self.canceled:
+                    healthy = False
+                    break
+                line = worker.read_line(0.5)
+                if line is None:
+                    if time.monotonic() < deadline:
+                        continue
+                    healthy = False
+                    self.log(
+                        f"SteamCMD reported nothing for {int(item_timeout)}s; giving up on {len(pending_ids)} item(s).",
+                        tone="warn",
+                        source="download",
+                        action="steamcmd_item_timeout",
+                        context={
+                            "slot": int(slot),
+                            "pending": len(pending_ids),
+                            "timeout_sec": item_timeout,
+                            "operation_state": "warn",
+                        },
+                        operation_id=str(self._active_download_operation_id or ""),
+                    )
+                    break
+                if not line:
+                    healthy = False
+                    break
+                deadline = time.monotonic() + item_timeout
                 clean_line = line.strip()
                 if not clean_line:
                     continue
                 status_updated = False
 
+                if session_error_re.search(clean_line):
+                    healthy = False
+                    for mod_id in pending_ids:
+                        failure_details.setdefault(mod_id, clean_line)
+                    worker.close(force=True)
+                    continue
+
                 success_match = success_re.search(clean_line)
                 if success_match:
                     mod_id = str(success_match.group(1))
+                    pending_ids.discard(mod_id)
+                    worker.item_ids.add(mod_id)
                     if mod_id in status_map and status_map.get(mod_id) != "Downloaded":
                         status_map[mod_id] = "Downloaded"
+                        self._mark_session_steamcmd_downloaded(mod_lookup[mod_id])
+                        try:
+                            move_futures[mod_id] = self._move_executor.submit(
+                                self._move_completed_steamcmd_item, mod_lookup[mod_id], cancel_is_immediate
+                            )
+                        except RuntimeError:
+                            pass
+                    continue
+
+                timeout_match = timeout_re.search(clean_line)
+                if timeout_match:
+                    mod_id = str(timeout_match.group(1))
+                    if mod_id in pending_ids:
+                        pending_ids.discard(mod_id)
+                        healthy = False
+                        status_map.pop(mod_id, None)
+                        failure_details[mod_id] = clean_line
                     continue
 
                 fail_match = failure_re.search(clean_line)
                 if fail_match:
                     mod_id = str(fail_match.group(1))
+                    pending_ids.discard(mod_id)
+                    healthy = False
                     if mod_id in status_map:
                         failure_reason = str(fail_match.group(2)).strip() or "Unknown error"
                         next_status = f"Failed: {failure_reason}"
@@ -3327,9 +6057,11 @@ class StreamlineWebBackend:
                                 status_updated = True
                 if status_updated:
                     self._maybe_log_download_progress(str(self._active_download_operation_id or ""), force=False)
-
-        self.current_process.wait()
-        self.current_process = None
+        finally:
+            worker.items_done += len(items) - len(pending_ids)
+            self._release_steamcmd_worker(slot, worker, healthy and not pending_ids)
+            for mod_id in pending_ids:
+                status_map.pop(mod_id, None)
 
         fallback_status = "Downloading" if (cancel_is_immediate and self.canceled) else "Failed No Confirmation"
         confirmed_mod_ids = set()
@@ -3361,12 +6093,15 @@ class StreamlineWebBackend:
                         )
                 self._set_mod_status(mod, final_status, failure_detail=failure_detail)
 
+        for mod_id, future in move_futures.items():
+            try:
+                if future.result():
+                    confirmed_mod_ids.discard(mod_id)
+            except Exception:
+                pass
         if confirmed_mod_ids and not (cancel_is_immediate and self.canceled):
             self._move_all_downloaded_mods(mod_ids=confirmed_mod_ids)
 
-        if not (cancel_is_immediate and self.canceled):
-            self._cleanup_appworkshop_acf_files()
-
         for mod in retry_mods:
             current_retry = int(mod.get("retry_count", 0) or 0)
             next_retry = current_retry + 1
@@ -3388,7 +6123,13 @@ class StreamlineWebBackend:
                     failure_detail=failure_detail,
                 )
 
-        self._maybe_log_download_progress(str(self._active_download_operation_id or ""), force=True)
+    def _remove_downloaded_from_queue_locked(self):
+        downloaded_ids = self._queue_index.filter_ids("Downloaded")
+        removed_ids = self._remove_queue_mods_locked(downloaded_ids)
+        if not removed_ids:
+            return 0
+        self._journal_queue_locked({"op": "remove", "mod_ids": removed_ids})
+        return len(removed_ids)
 
     def _finalize_cancellation(self, delete_downloads):
         keep_downloaded = bool(self.config["keep_downloaded_in_queue"])
@@ -3409,13 +6150,12 @@ class StreamlineWebBackend:
             for mod in self.download_queue:
                 status = str(mod.get("status", ""))
                 if status == "Downloading":
-                    mod["status"] = "Queued"
+                    self._update_queue_mod_fields_locked(mod, {"status": "Queued"})
                 elif delete_downloads and status == "Downloaded":
-                    mod["status"] = "Queued"
+                    self._update_queue_mod_fields_locked(mod, {"status": "Queued"})
 
             if not keep_downloaded:
-                self.download_queue = [mod for mod in self.download_queue if mod.get("status") != "Downloaded"]
-            self._rebuild_queue_indexes_locked()
+                self._remove_downloaded_from_queue_locked()
 
         self._cleanup_appworkshop_acf_files()
 
@@ -3449,7 +6189,7 @@ class StreamlineWebBackend:
                     if provider not in {"SteamCMD", "SteamWebAPI"}:
                         resolved = self._provider_for_mod(mod, self.config.get("download_provider", "Default"))
                         with self.state_lock:
-                            mod["provider"] = resolved
+                            self._update_queue_mod_fields_locked(mod, {"provider": resolved})
                         provider = resolved
                         provider_changed = True
                     if provider == "SteamCMD":
@@ -3477,8 +6217,7 @@ class StreamlineWebBackend:
 
                 if not self.config["keep_downloaded_in_queue"]:
                     with self.state_lock:
-                        self.download_queue = [mod for mod in self.download_queue if mod.get("status") != "Downloaded"]
-                        self._rebuild_queue_indexes_locked()
+                        self._remove_downloaded_from_queue_locked()
 
                 self._emit_event("queue", {"action": "refresh"})
 
@@ -3495,8 +6234,7 @@ class StreamlineWebBackend:
                 self._cleanup_appworkshop_acf_files()
                 if not self.config["keep_downloaded_in_queue"]:
                     with self.state_lock:
-                        self.download_queue = [mod for mod in self.download_queue if mod.get("status") != "Downloaded"]
-                        self._rebuild_queue_indexes_locked()
+                        self._remove_downloaded_from_queue_locked()
 
             with self.state_lock:
                 snapshot = self._get_active_download_progress_snapshot_locked() or {
@@ -3582,8 +6320,7 @@ class StreamlineWebBackend:
                 for mod in self.download_queue:
                     mod_id = str(mod.get("mod_id", "")).strip()
                     if mod_id in active_targets and mod.get("status") == "Downloading":
-                        mod["status"] = "Failed: Worker Error"
-                self._rebuild_queue_indexes_locked()
+                        self._update_queue_mod_fields_locked(mod, {"status": "Failed: Worker Error"})
                 self.is_downloading = False
                 self._active_download_operation_id = ""
                 self._active_download_targets = set()
@@ -3686,9 +6423,11 @@ class StreamlineWebBackend:
             if not self.is_downloading:
                 return {"success": False, "error": "No active download."}
             self.canceled = True
-        if delete_on_cancel and self.current_process and self.current_process.poll() is None:
+            processes = list(self.steamcmd_processes) if delete_on_cancel else []
+        for process in processes:
             try:
-                self.current_process.terminate()
+                if process.poll() is None:
+                    process.terminate()
             except Exception:
                 pass
         mode = "immediate" if delete_on_cancel else "after_batch"
@@ -3703,6 +6442,9 @@ class StreamlineWebBackend:
             self._shutting_down = True
 
         self._stop_clipboard_monitoring()
+        with self._event_sink_lock:
+            self._event_sink = None
+        self.events.close()
         try:
             self.close_steamcmd_login_session(force=True)
         except Exception:
@@ -3711,10 +6453,10 @@ class StreamlineWebBackend:
 
         with self.state_lock:
             self.canceled = True
-            process = self.current_process
+            processes = list(self.steamcmd_processes)
             worker = self._download_worker_thread
 
-        if process is not None:
+        for process in processes:
             try:
                 if process.poll() is None:
                     process.terminate()
@@ -3728,6 +6470,7 @@ class StreamlineWebBackend:
                             pass
             except Exception:
                 pass
+        self._close_steamcmd_workers(force=True)
 
         if worker is not None and worker.is_alive() and worker is not threading.current_thread():
             try:
@@ -3744,7 +6487,7 @@ class StreamlineWebBackend:
             except Exception:
                 pass
 
-        for executor in (self._queue_build_executor, self._hydration_executor):
+        for executor in (self._queue_build_executor, self._hydration_executor, self._move_executor):
             try:
                 executor.shutdown(wait=False, cancel_futures=True)
             except TypeError:
@@ -3772,7 +6515,17 @@ class StreamlineWebBackend:
 
         self.save_config(immediate=True)
         self._flush_metadata_cache_save()
+        try:
+            self._metadata_cache_store.evict()
+        except Exception:
+            pass
+        self._metadata_cache_store.close()
+        self._http_cache.close()
+        self._prune_webapi_store()
         self._flush_pending_mod_logs_save()
+        self._compact_queue_journal(wait=True)
+        self._queue_journal.close()
+        self.http.close()
 
         with self._shutdown_lock:
             self._shutdown_complete = True
@@ -3781,6 +6534,9 @@ class StreamlineWebBackend:
             "download_worker_stopped": not bool(worker and worker.is_alive()),
         }
 
+    def get_network_stats(self):
+        return {"success": True, "http": self.http.stats()}
+
     def open_downloads_folder(self, mod_id=None):
         target = self.downloads_root
         if mod_id:
@@ -4135,11 +6891,7 @@ class StreamlineWebBackend:
             return ""
         url = f"https://steamcommunity.com/profiles/{steam_id}?xml=1"
         try:
-            response = requests.get(
-                url,
-                timeout=(6, 18),
-                headers={"User-Agent": "Mozilla/5.0"},
-            )
+            response = self.http.get(url, timeout=(6, 18))
             if response.status_code != 200:
                 return ""
             body = str(response.text or "")
@@ -4155,11 +6907,7 @@ class StreamlineWebBackend:
             return ""
 
         try:
-            image_response = requests.get(
-                avatar_url,
-                timeout=(6, 18),
-                headers={"User-Agent": "Mozilla/5.0"},
-            )
+            image_response = self.http.get(avatar_url, timeout=(6, 18))
             if image_response.status_code == 200:
                 content = image_response.content or b""
                 if content:
@@ -4243,9 +6991,17 @@ class StreamlineWebBackend:
                 ordered.append(path)
         return ordered
 
+    def _get_steamcmd_shard_root_paths(self):
+        shards_root = os.path.join(self.steamcmd_dir, "shards")
+        try:
+            names = sorted(os.listdir(shards_root))
+        except OSError:
+            return []
+        return [os.path.join(shards_root, name) for name in names if os.path.isdir(os.path.join(shards_root, name))]
+
     def _get_steamcmd_workshop_dir_paths(self):
         workshop_dirs = []
-        for root_path in self._get_steamcmd_runtime_root_candidates():
+        for root_path in self._get_steamcmd_runtime_root_candidates() + self._get_steamcmd_shard_root_paths():
             workshop_dir = os.path.join(root_path, "steamapps", "workshop")
             if workshop_dir not in workshop_dirs:
                 workshop_dirs.append(workshop_dir)
@@ -4487,6 +7243,7 @@ class StreamlineWebBackend:
                 except Exception:
                     pass
                 self.steamcmd_login_session = None
+        self._close_steamcmd_workers()
 
         try:
             conn_offset = self._get_file_size(self._get_steamcmd_connection_log_path())